@@ -30,7 +30,18 @@ class Settings(BaseSettings):
     GOOGLE_PLACES_LANGUAGE_CODE: str = "ko"
     GOOGLE_PLACES_MIN_RATING: float = 4.0
     GOOGLE_PLACES_LLM_RERANK_ENABLED: bool = True
+    GOOGLE_PLACES_MAX_CONCURRENCY: int = 8
+    GOOGLE_PLACES_PROCESS_MAX_CONCURRENCY: int = 16
     GOOGLE_PLACES_LLM_RERANK_MAX_CANDIDATES: int = 5
+    GOOGLE_PLACES_LLM_RERANK_MAX_CONCURRENCY: int = 4
+    GOOGLE_PLACES_EMPTY_RESULT_CACHE_TTL_SECONDS: int = 900
+    GOOGLE_PLACES_EMPTY_RESULT_CACHE_MAX_SIZE: int = 10000
+    ROADMAP_SKELETON_MAX_CONCURRENCY: int = 4
+    ROADMAP_PLACE_DETAIL_BATCH_MAX_SIZE: int = 1
+    ROADMAP_PLACE_DETAIL_BATCH_WINDOW_MS: int = 50
+    ROADMAP_PLACE_DESCRIPTION_CACHE_TTL_SECONDS: int = 604800
+    ROADMAP_PLACE_DESCRIPTION_CACHE_MAX_SIZE: int = 10000
+    ROADMAP_UNPLANNED_FALLBACK_DESCRIPTIONS: bool = False
     VISIT_TIME_START: str = "09:00"
     VISIT_TIME_STAY_MINUTES: int = 90
     VISIT_TIME_TRANSIT_FACTOR: float = 15.0
@@ -67,6 +78,21 @@ class Settings(BaseSettings):
             numeric = 4.0
         return min(5.0, max(0.0, numeric))
 
+    @field_validator(
+        "GOOGLE_PLACES_MAX_CONCURRENCY",
+        "GOOGLE_PLACES_PROCESS_MAX_CONCURRENCY",
+        "GOOGLE_PLACES_LLM_RERANK_MAX_CONCURRENCY",
+        "ROADMAP_SKELETON_MAX_CONCURRENCY",
+        mode="before",
+    )
+    @classmethod
+    def _clamp_concurrency(cls, value: object) -> int:
+        try:
+            numeric = int(value) if value is not None else 1
+        except (TypeError, ValueError):
+            numeric = 1
+        return max(1, numeric)
+
     @field_validator("GOOGLE_PLACES_LLM_RERANK_MAX_CANDIDATES", mode="before")
     @classmethod
     def _clamp_google_places_llm_rerank_max_candidates(cls, value: object) -> int:
@@ -55,6 +55,15 @@ class GeoRectangle:
         lng = float(longitude)
         return self.min_lat <= lat <= self.max_lat and self.min_lng <= lng <= self.max_lng
 
+    def contains_many(self, points: Iterable[tuple[float, float]]) -> list[bool]:
+        """여러 점의 포함 여부를 한 번에 계산합니다.
+
+        경계값을 지역 변수로 고정해 점마다 메서드 호출과 속성 조회를 반복하지 않습니다.
+        """
+        min_lat, max_lat = self.min_lat, self.max_lat
+        min_lng, max_lng = self.min_lng, self.max_lng
+        return [min_lat <= lat <= max_lat and min_lng <= lng <= max_lng for lat, lng in points]
+
     def to_google_location_restriction_payload(self) -> dict[str, dict[str, float]]:
         """Google Places `locationRestriction` 페이로드 형식으로 직렬화합니다."""
         return {
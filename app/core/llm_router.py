@@ -8,6 +8,7 @@ from time import perf_counter
 from typing import Any
 
 from langchain_openai import ChatOpenAI
+from pydantic import BaseModel
 
 from app.core.config import Settings, get_settings
 from app.core.logger import get_logger
@@ -118,6 +119,28 @@ def _resolve_temperature(temperature: float | None) -> float:
     return float(temperature)
 
 
+def _build_call_kwargs(response_format: dict[str, Any] | None) -> dict[str, Any]:
+    if response_format is None:
+        return {}
+    return {"response_format": response_format}
+
+
+@lru_cache(maxsize=32)
+def json_schema_response_format(model: type[BaseModel]) -> dict[str, Any]:
+    """Pydantic 모델로 provider-native JSON schema 응답 형식을 생성합니다.
+
+    Optional 필드를 그대로 쓰기 위해 strict 모드는 사용하지 않습니다.
+    """
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": model.__name__,
+            "schema": model.model_json_schema(),
+            "strict": False,
+        },
+    }
+
+
 def _log_success(
     *,
     stage: Stage,
@@ -172,6 +195,7 @@ def invoke(
     settings: Settings | None = None,
     timeout_seconds: int | None = None,
     temperature: float | None = None,
+    response_format: dict[str, Any] | None = None,
 ) -> Any:
     """Stage 기준으로 모델을 선택해 동기 LLM 호출을 수행합니다."""
     resolved_settings = settings or get_settings()
@@ -179,6 +203,7 @@ def invoke(
     resolved_temperature = _resolve_temperature(temperature)
     selected_model, tier, routing_enabled = resolve_model(stage, resolved_settings)
     fallback_model = _normalize_model_name(resolved_settings.LLM_MODEL_NAME)
+    call_kwargs = _build_call_kwargs(response_format)
 
     started = perf_counter()
     try:
@@ -188,7 +213,7 @@ def invoke(
             resolved_timeout,
             resolved_settings.OPENAI_API_KEY,
         )
-        response = client.invoke(payload)
+        response = client.invoke(payload, **call_kwargs)
         _log_success(
             stage=stage,
             tier=tier,
@@ -231,7 +256,7 @@ def invoke(
         resolved_settings.OPENAI_API_KEY,
     )
     try:
-        response = fallback_client.invoke(payload)
+        response = fallback_client.invoke(payload, **call_kwargs)
         _log_success(
             stage=stage,
             tier=tier,
@@ -262,6 +287,7 @@ async def ainvoke(
     settings: Settings | None = None,
     timeout_seconds: int | None = None,
     temperature: float | None = None,
+    response_format: dict[str, Any] | None = None,
 ) -> Any:
     """Stage 기준으로 모델을 선택해 비동기 LLM 호출을 수행합니다."""
     resolved_settings = settings or get_settings()
@@ -269,6 +295,7 @@ async def ainvoke(
     resolved_temperature = _resolve_temperature(temperature)
     selected_model, tier, routing_enabled = resolve_model(stage, resolved_settings)
     fallback_model = _normalize_model_name(resolved_settings.LLM_MODEL_NAME)
+    call_kwargs = _build_call_kwargs(response_format)
 
     started = perf_counter()
     try:
@@ -278,7 +305,7 @@ async def ainvoke(
             resolved_timeout,
             resolved_settings.OPENAI_API_KEY,
         )
-        response = await client.ainvoke(payload)
+        response = await client.ainvoke(payload, **call_kwargs)
         _log_success(
             stage=stage,
             tier=tier,
@@ -321,7 +348,7 @@ async def ainvoke(
         resolved_settings.OPENAI_API_KEY,
     )
     try:
-        response = await fallback_client.ainvoke(payload)
+        response = await fallback_client.ainvoke(payload, **call_kwargs)
         _log_success(
             stage=stage,
             tier=tier,
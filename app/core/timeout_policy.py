@@ -77,6 +77,11 @@ def get_timeout_policy(settings: Settings | None = None) -> TimeoutPolicy:
     return build_timeout_policy(resolved_settings)
 
 
+def fallback_grace_timeout(timeout_seconds: int) -> int:
+    """ainvoke 내부 fallback 시도 여유를 위해 외부 wait_for 타임아웃을 확장합니다."""
+    return max(_MIN_TIMEOUT_SECONDS, int(timeout_seconds) * 2)
+
+
 def to_requests_timeout(total_timeout_seconds: int) -> tuple[float, float]:
     """requests용 (connect, read) 타임아웃 튜플을 생성합니다."""
     total = float(max(_MIN_TIMEOUT_SECONDS, int(total_timeout_seconds)))
@@ -0,0 +1,70 @@
+"""프로세스 단위 TTL + LRU 캐시."""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from time import monotonic
+from typing import Generic, Hashable, Iterable, TypeVar
+
+KeyT = TypeVar("KeyT", bound=Hashable)
+ValueT = TypeVar("ValueT")
+
+
+class TTLCache(Generic[KeyT, ValueT]):
+    """만료 시간과 최대 크기를 가진 LRU 캐시.
+
+    최대 크기를 넘으면 가장 오래 사용하지 않은 항목부터 제거합니다.
+    """
+
+    def __init__(self, *, max_size: int, ttl_seconds: float) -> None:
+        self._max_size = max(1, int(max_size))
+        self._ttl_seconds = max(0.0, float(ttl_seconds))
+        self._entries: OrderedDict[KeyT, tuple[float, ValueT]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _get_locked(self, key: KeyT, now: float) -> ValueT | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= now:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def get(self, key: KeyT) -> ValueT | None:
+        """만료되지 않은 값을 반환합니다. 없으면 None입니다."""
+        with self._lock:
+            return self._get_locked(key, monotonic())
+
+    def get_many(self, keys: Iterable[KeyT]) -> dict[KeyT, ValueT]:
+        """조회된 키만 포함한 딕셔너리를 반환합니다. 잠금은 한 번만 잡습니다."""
+        found: dict[KeyT, ValueT] = {}
+        with self._lock:
+            now = monotonic()
+            for key in keys:
+                if key in found:
+                    continue
+                value = self._get_locked(key, now)
+                if value is not None:
+                    found[key] = value
+        return found
+
+    def set(self, key: KeyT, value: ValueT) -> None:
+        """값을 저장하고 용량 초과 시 오래된 항목을 제거합니다."""
+        with self._lock:
+            self._entries[key] = (monotonic() + self._ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """모든 항목을 제거합니다."""
+        with self._lock:
+            self._entries.clear()
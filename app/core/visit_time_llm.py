@@ -11,7 +11,7 @@ from pydantic import BaseModel, Field
 
 from app.core.llm_router import Stage, ainvoke
 from app.core.logger import get_logger
-from app.core.timeout_policy import get_timeout_policy
+from app.core.timeout_policy import fallback_grace_timeout, get_timeout_policy
 
 logger = get_logger(__name__)
 
@@ -84,11 +84,6 @@ def _to_proposal_map(plan: VisitTimeProposalPlan) -> dict[int, dict[int, str]]:
     return proposal_map
 
 
-def _fallback_grace_timeout(timeout_seconds: int) -> int:
-    """ainvoke 내부 fallback 시도 여유를 위해 외부 wait_for 타임아웃을 확장합니다."""
-    return max(1, int(timeout_seconds) * 2)
-
-
 async def propose_visit_times_for_days(
     daily_places: list[dict],
     *,
@@ -104,7 +99,7 @@ async def propose_visit_times_for_days(
     parser = PydanticOutputParser(pydantic_object=VisitTimeProposalPlan)
     policy = get_timeout_policy()
     resolved_timeout = timeout_seconds or policy.llm_timeout_seconds
-    wait_timeout = _fallback_grace_timeout(resolved_timeout)
+    wait_timeout = fallback_grace_timeout(resolved_timeout)
     input_days = _build_input_days(daily_places)
 
     system_prompt = (
@@ -147,7 +142,7 @@ async def propose_visit_times_for_days(
 
     try:
         content = _strip_code_fence(response.content)
-        parsed = parser.parse(content)
+        parsed = VisitTimeProposalPlan.model_validate_json(content)
         return _to_proposal_map(parsed)
     except Exception:
         logger.exception("Visit time proposal parse failed")
@@ -12,6 +12,7 @@ from app.core.timeout_policy import get_timeout_policy
 from app.graph.chat.state import ChatState
 from app.graph.chat.utils import build_diff_key, reorder_visit_sequence
 from app.schemas.enums import ChatOperation, ChatStatus
+from app.schemas.place import PLACE_LIST_ADAPTER
 from app.services.google_places_service import get_google_places_service
 from app.services.place_rerank_service import select_place_id_for_chat
 
@@ -61,18 +62,22 @@ def _find_day(itinerary: dict, day_number: int) -> dict | None:
     return None
 
 
-def _reorder_results_by_place_id(results: list, selected_place_id: str) -> list:
+def _move_selected_result_first(results: list, search_results: list[dict], selected_place_id: str) -> bool:
+    """선택된 장소를 검색 결과와 직렬화된 결과 양쪽에서 제자리로 맨 앞으로 옮깁니다."""
     selected_index = next(
         (index for index, place in enumerate(results) if place.place_id == selected_place_id),
         None,
     )
     if selected_index in (None, 0):
-        return results
-    return [results[selected_index], *results[:selected_index], *results[selected_index + 1 :]]
+        return False
+    results.insert(0, results.pop(selected_index))
+    search_results.insert(0, search_results.pop(selected_index))
+    return True
 
 
 def _hard_filter_by_bbox(results: list, bbox: GeoRectangle) -> tuple[list, int]:
-    filtered = [p for p in results if bbox.contains(p.geometry.latitude, p.geometry.longitude)]
+    mask = bbox.contains_many((p.geometry.latitude, p.geometry.longitude) for p in results)
+    filtered = [p for p, inside in zip(results, mask, strict=True) if inside]
     return filtered, max(0, len(results) - len(filtered))
 
 
@@ -248,7 +253,7 @@ async def _search_place(intent: dict, day: dict) -> tuple:
         logger.error("Google Places search failed: %s", exc)
         return None, [], {"error": "장소 검색에 실패했습니다."}
 
-    search_results = [r.model_dump() for r in results]
+    search_results = PLACE_LIST_ADAPTER.dump_python(results)
     if not results:
         suggested = _suggest_alternative_keyword(keyword)
         return (
@@ -265,13 +270,13 @@ async def _search_place(intent: dict, day: dict) -> tuple:
     if rerank_enabled and len(results) > 1:
         selected_place_id = await select_place_id_for_chat(
             keyword=keyword,
-            candidates=[place.model_dump() for place in results[:rerank_max_candidates]],
+            candidates=search_results[:rerank_max_candidates],
             day=day,
             max_candidates=rerank_max_candidates,
             timeout_seconds=rerank_timeout_seconds,
         )
         if selected_place_id:
-            results = _reorder_results_by_place_id(results, selected_place_id)
+            _move_selected_result_first(results, search_results, selected_place_id)
         logger.info(
             "Chat place rerank result: flow=chat batch_size=%d selected=%d missed=%d fallback_used=%s",
             min(rerank_max_candidates, len(results)),
@@ -280,7 +285,6 @@ async def _search_place(intent: dict, day: dict) -> tuple:
             selected_place_id is None,
         )
 
-    search_results = [r.model_dump() for r in results]
     return results[0], search_results, None
 
 
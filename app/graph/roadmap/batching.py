@@ -0,0 +1,82 @@
+"""동시 요청 LLM 호출 마이크로 배칭 유틸."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Generic, TypeVar
+
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+InputT = TypeVar("InputT")
+OutputT = TypeVar("OutputT")
+
+
+@dataclass(slots=True)
+class _PendingItem(Generic[InputT, OutputT]):
+    payload: InputT
+    future: asyncio.Future[OutputT | None] = field(repr=False)
+
+
+class MicroBatcher(Generic[InputT, OutputT]):
+    """짧은 대기 구간 동안 들어온 요청을 모아 한 번에 처리합니다.
+
+    `flush_fn`은 입력 목록과 같은 길이·순서의 결과 목록을 반환해야 하며,
+    처리에 실패한 항목은 None을 반환합니다.
+    """
+
+    def __init__(
+        self,
+        flush_fn: Callable[[list[InputT]], Awaitable[list[OutputT | None]]],
+        *,
+        max_batch_size: int,
+        window_seconds: float,
+    ) -> None:
+        self._flush_fn = flush_fn
+        self._max_batch_size = max(1, int(max_batch_size))
+        self._window_seconds = max(0.0, float(window_seconds))
+        self._pending: list[_PendingItem[InputT, OutputT]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._flush_tasks: set[asyncio.Task] = set()
+
+    async def submit(self, payload: InputT) -> OutputT | None:
+        """요청을 배치에 추가하고 해당 요청의 결과를 기다립니다."""
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[OutputT | None] = loop.create_future()
+        self._pending.append(_PendingItem(payload=payload, future=future))
+
+        if len(self._pending) >= self._max_batch_size:
+            self._start_flush(loop)
+        elif self._timer is None:
+            self._timer = loop.call_later(self._window_seconds, self._start_flush, loop)
+
+        return await future
+
+    def _start_flush(self, loop: asyncio.AbstractEventLoop) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+
+        batch = self._pending
+        self._pending = []
+        task = loop.create_task(self._flush(batch))
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def _flush(self, batch: list[_PendingItem[InputT, OutputT]]) -> None:
+        results: list[OutputT | None] = []
+        try:
+            results = await self._flush_fn([item.payload for item in batch])
+        except Exception:
+            logger.exception("Micro batch flush failed: batch_size=%d", len(batch))
+
+        if len(results) != len(batch):
+            results = [None] * len(batch)
+
+        for item, result in zip(batch, results, strict=True):
+            if not item.future.done():
+                item.future.set_result(result)
@@ -4,27 +4,38 @@ from __future__ import annotations
 
 import asyncio
 import json
+import weakref
 from datetime import timedelta
+from functools import lru_cache
+from typing import Any
+from urllib.parse import quote_plus
 
-from langchain_core.output_parsers import PydanticOutputParser
 from langchain_core.prompts import ChatPromptTemplate
 from pydantic import BaseModel, Field
 
-from app.core.llm_router import Stage, ainvoke
+from app.core.config import get_settings
+from app.core.llm_router import Stage, ainvoke, json_schema_response_format
 from app.core.logger import get_logger
-from app.core.timeout_policy import get_timeout_policy
+from app.core.timeout_policy import fallback_grace_timeout, get_timeout_policy
+from app.core.ttl_cache import TTLCache
 from app.core.visit_time_llm import propose_visit_times_for_days
 from app.core.visit_time_policy import (
     VisitTimeOutputMode,
     apply_visit_time_policy,
     build_visit_time_policy_config,
 )
+from app.graph.roadmap.batching import MicroBatcher
 from app.graph.roadmap.state import RoadmapState
 from app.graph.roadmap.utils import build_slot_key, strip_code_fence
 from app.schemas.course import CourseRequest, CourseResponseLLMOutput, PlanningPreference
 
 logger = get_logger(__name__)
 
+_DESCRIPTION_CACHE_VERSION = "v1"
+_CONTEXT_DAY_LINE = "\nDay %d (%s):"
+_CONTEXT_PLACE_LINE = "- %s: %s (키워드: %s)"
+_GMAPS_SEARCH_URL = "https://www.google.com/maps/search/?api=1&query={name}&query_place_id={place_id}"
+
 
 class PlaceDetailSlot(BaseModel):
     """방문 순서별 상세 정보 모델."""
@@ -46,15 +57,23 @@ class PlaceDetailPlan(BaseModel):
     days: list[PlaceDetailDay] = Field(..., description="일자별 장소 상세 결과")
 
 
-def _fallback_grace_timeout(timeout_seconds: int) -> int:
-    """ainvoke 내부 fallback 시도 여유를 위해 외부 wait_for 타임아웃을 확장합니다."""
-    return max(1, int(timeout_seconds) * 2)
+class PlaceDetailBatchItem(BaseModel):
+    """배치 요청 내 단일 요청의 장소 상세 결과 모델."""
+
+    request_id: int = Field(..., ge=0, description="입력 요청 식별자")
+    days: list[PlaceDetailDay] = Field(..., description="일자별 장소 상세 결과")
+
+
+class PlaceDetailBatchPlan(BaseModel):
+    """여러 요청을 묶어 생성한 장소 상세 결과 모델."""
+
+    requests: list[PlaceDetailBatchItem] = Field(..., description="요청별 장소 상세 결과")
 
 
 def _prepare_final_context(
     state: RoadmapState,
-) -> tuple[str, list[dict]]:
-    """LLM 입력 컨텍스트와 일자별 장소 목록을 생성합니다."""
+) -> tuple[str, list[dict], CourseRequest]:
+    """LLM 입력 컨텍스트, 일자별 장소 목록, 검증된 요청을 생성합니다."""
     skeleton_plan = state.get("skeleton_plan")
     fetched_places = state.get("fetched_places")
     raw_request = state.get("course_request")
@@ -67,19 +86,27 @@ def _prepare_final_context(
         raise ValueError("Context 생성을 위한 `course_request` 데이터가 없습니다.")
 
     try:
-        course_request = CourseRequest.model_validate(raw_request)
+        course_request = (
+            raw_request if isinstance(raw_request, CourseRequest) else CourseRequest.model_validate(raw_request)
+        )
     except Exception as exc:
         raise ValueError(f"CourseRequest 모델 유효성 검증에 실패했습니다: {exc}") from exc
 
     planning_preference = course_request.planning_preference
     planned = planning_preference == PlanningPreference.PLANNED
 
+    start_date = course_request.start_date
+    daily_dates = {
+        day_number: (start_date + timedelta(days=day_number - 1)).isoformat()
+        for day_number in {day_plan["day_number"] for day_plan in skeleton_plan}
+    }
+
     context_lines = []
     daily_places_for_schema = []
     for day_plan in skeleton_plan:
         day_number = day_plan["day_number"]
-        current_date = course_request.start_date + timedelta(days=day_number - 1)
-        context_lines.append(f"\nDay {day_number} ({current_date.strftime('%Y-%m-%d')}):")
+        daily_date = daily_dates[day_number]
+        context_lines.append(_CONTEXT_DAY_LINE % (day_number, daily_date))
 
         day_places = []
         visit_sequence_counter = 1
@@ -91,14 +118,14 @@ def _prepare_final_context(
                 section = slot.get("section")
                 section_label = section or "UNKNOWN"
                 keyword = slot.get("keyword")
-                context_lines.append(f"- {section_label}: {place['name']} (키워드: {keyword})")
+                context_lines.append(_CONTEXT_PLACE_LINE % (section_label, place["name"], keyword))
 
                 geometry = place.get("geometry") or {}
                 place_url = place.get("url")
                 if not place_url and place.get("place_id"):
-                    place_url = (
-                        "https://www.google.com/maps/search/?api=1&query="
-                        f"{place['name']}&query_place_id={place.get('place_id')}"
+                    place_url = _GMAPS_SEARCH_URL.format(
+                        name=quote_plus(place["name"]),
+                        place_id=quote_plus(place["place_id"]),
                     )
 
                 day_places.append(
@@ -117,11 +144,9 @@ def _prepare_final_context(
                 )
                 visit_sequence_counter += 1
 
-        daily_places_for_schema.append(
-            {"day_number": day_number, "daily_date": current_date.isoformat(), "places": day_places}
-        )
+        daily_places_for_schema.append({"day_number": day_number, "daily_date": daily_date, "places": day_places})
 
-    return "\n".join(context_lines), daily_places_for_schema
+    return "\n".join(context_lines), daily_places_for_schema, course_request
 
 
 def _safe_next_action_suggestions(trip_days: int) -> list[str]:
@@ -137,110 +162,291 @@ def _safe_next_action_suggestions(trip_days: int) -> list[str]:
     return suggestions
 
 
-async def _fill_place_descriptions_with_llm(daily_places: list[dict]) -> list[dict]:
-    """LLM을 통해 장소 description을 채웁니다."""
-    parser = PydanticOutputParser(pydantic_object=PlaceDetailPlan)
-    timeout_seconds = get_timeout_policy().llm_timeout_seconds
-    wait_timeout_seconds = _fallback_grace_timeout(timeout_seconds)
-
-    def _fallback_description(place: dict) -> str:
-        place_name = place.get("place_name") or "장소"
-        return f"{place_name}에서 즐기는 대표 활동입니다."
-
-    def _apply_fallback() -> list[dict]:
-        for day in daily_places:
-            for place in day.get("places", []):
-                if not place.get("description"):
-                    place["description"] = _fallback_description(place)
-        return daily_places
+def _fallback_description(place: dict) -> str:
+    place_name = place.get("place_name") or "장소"
+    return f"{place_name}에서 즐기는 대표 활동입니다."
 
-    if not any(day.get("places") for day in daily_places):
-        return _apply_fallback()
 
+def _apply_fallback_descriptions(daily_places: list[dict]) -> list[dict]:
+    """비어 있는 description을 장소명 기반 기본 문구로 채웁니다."""
+    for day in daily_places:
+        for place in day.get("places", []):
+            if not place.get("description"):
+                place["description"] = _fallback_description(place)
+    return daily_places
+
+
+def _build_description_input_days(daily_places: list[dict], skip_cache_keys: set[tuple[str, str]]) -> list[dict]:
     input_days = []
     for day in daily_places:
-        input_days.append(
+        places = [
             {
-                "day_number": day.get("day_number"),
-                "daily_date": day.get("daily_date"),
-                "places": [
-                    {
-                        "visit_sequence": place.get("visit_sequence"),
-                        "place_name": place.get("place_name"),
-                        "address": place.get("address"),
-                        "latitude": place.get("latitude"),
-                        "longitude": place.get("longitude"),
-                        "place_url": place.get("place_url"),
-                    }
-                    for place in day.get("places", [])
-                ],
+                "visit_sequence": place.get("visit_sequence"),
+                "place_name": place.get("place_name"),
+                "address": place.get("address"),
+                "latitude": place.get("latitude"),
+                "longitude": place.get("longitude"),
+                "place_url": place.get("place_url"),
             }
-        )
+            for place in day.get("places", [])
+            if _description_cache_key(place) not in skip_cache_keys
+        ]
+        if places:
+            input_days.append(
+                {
+                    "day_number": day.get("day_number"),
+                    "daily_date": day.get("daily_date"),
+                    "places": places,
+                }
+            )
+    return input_days
+
+
+_DESCRIPTION_SYSTEM_PROMPT = (
+    "당신은 여행 일정의 장소 설명을 작성하는 전문가입니다.\n"
+    "모든 장소에 대해 한국어 한 문장으로 description을 작성하세요.\n"
+    "description은 장소명 또는 대표 활동을 포함하고 30자 내외로 간결하게 작성하세요.\n"
+    "과장, 이모지, 해시태그, 불확실한 정보는 피하고 입력 정보에 기반해 작성하세요.\n"
+    "입력에 없는 장소를 추가하거나 방문 순서를 바꾸지 말고 JSON만 반환하세요."
+)
+_DESCRIPTION_PROMPT = ChatPromptTemplate.from_messages(
+    [
+        ("system", _DESCRIPTION_SYSTEM_PROMPT),
+        ("human", "아래 장소 목록을 기반으로 각 장소의 description을 채워주세요.\n입력 데이터:\n{places}"),
+    ]
+)
+_DESCRIPTION_BATCH_PROMPT = ChatPromptTemplate.from_messages(
+    [
+        ("system", _DESCRIPTION_SYSTEM_PROMPT),
+        (
+            "human",
+            "아래는 서로 독립적인 여러 여행 일정입니다. 각 request_id별로 장소의 description을 채워주세요.\n"
+            "request_id와 day_number, visit_sequence는 입력 값을 그대로 사용하세요.\n"
+            "입력 데이터:\n{places}",
+        ),
+    ]
+)
+_SUMMARY_PROMPT = ChatPromptTemplate.from_messages(
+    [
+        (
+            "system",
+            "당신은 전문 여행 플래너입니다. 주어진 여행 정보와 확정된 장소 목록을 바탕으로 "
+            "사용자를 위한 최종 여행 로드맵을 완성하는 역할을 합니다\n"
+            "창의적인 여행 제목과 매력적인 코스가 사용자에게 전달될 수 있도록 설명을 포함하세요\n"
+            "출력은 반드시 제공된 JSON 스키마를 엄격히 따라야 합니다",
+        ),
+        (
+            "human",
+            "## 사용자 요청\n"
+            "{course_request}\n\n"
+            "## 확정된 일자별 장소 목록\n"
+            "{itinerary_context}\n\n"
+            "## 생성 작업 가이드\n"
+            "1. '사용자 요청'을 참고하여 전체 여행을 아우르는 창의적이고 매력적인 `title`을 생성해주세요. "
+            "(반드시 한국어로 작성하되 10자 이내로 간결히 작성하고, 여행지 또는 도시명을 포함해주세요)\n"
+            "2. 로드맵을 한 줄로 요약한 `summary`를 한국어로 작성해주세요. (1문장)\n"
+            "3. 전체 일정에서 연상되는 핵심 키워드 3~5개를 `tags`에 한국어로 작성해주세요.\n"
+            "4. 사용자 요청과 확정된 장소 목록을 모두 고려하여 왜 이 코스가 사용자에게 최적인지 "
+            "설명하는 `llm_commentary`를 작성해주세요. (2-3문장)",
+        ),
+    ]
+)
 
-    system_prompt = (
-        "당신은 여행 일정의 장소 설명을 작성하는 전문가입니다.\n"
-        "모든 장소에 대해 한국어 한 문장으로 description을 작성하세요.\n"
-        "description은 장소명 또는 대표 활동을 포함하고 30자 내외로 간결하게 작성하세요.\n"
-        "과장, 이모지, 해시태그, 불확실한 정보는 피하고 입력 정보에 기반해 작성하세요.\n"
-        "입력에 없는 장소를 추가하거나 방문 순서를 바꾸지 말고 JSON만 반환하세요."
-    )
-    user_prompt = (
-        "아래 장소 목록을 기반으로 각 장소의 description을 채워주세요.\n입력 데이터:\n{places}\n\n{format_instructions}"
-    )
 
-    prompt = ChatPromptTemplate.from_messages([("system", system_prompt), ("human", user_prompt)])
-    messages = prompt.format_messages(
-        places=json.dumps(input_days, ensure_ascii=False, indent=2),
-        format_instructions=parser.get_format_instructions(),
-    )
+def _to_prompt_json(value: Any) -> str:
+    """프롬프트에 넣을 값을 공백 없는 JSON 문자열로 직렬화합니다."""
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def _build_description_messages(batch: list[list[dict]]) -> tuple[list, type[BaseModel]]:
+    if len(batch) == 1:
+        prompt = _DESCRIPTION_PROMPT
+        output_model: type[BaseModel] = PlaceDetailPlan
+        places = batch[0]
+    else:
+        prompt = _DESCRIPTION_BATCH_PROMPT
+        output_model = PlaceDetailBatchPlan
+        places = {"requests": [{"request_id": index, "days": days} for index, days in enumerate(batch)]}
+
+    messages = prompt.format_messages(places=_to_prompt_json(places))
+    return messages, output_model
+
+
+async def _invoke_place_details(batch: list[list[dict]]) -> list[PlaceDetailPlan | None]:
+    """요청별 입력 목록을 한 번의 LLM 호출로 처리해 요청 순서대로 결과를 반환합니다.
+
+    입력과 출력이 요청 수에 비례해 커지므로 타임아웃도 요청 수만큼 늘립니다.
+    """
+    timeout_seconds = get_timeout_policy().llm_timeout_seconds * len(batch)
+    wait_timeout_seconds = fallback_grace_timeout(timeout_seconds)
+    failed: list[PlaceDetailPlan | None] = [None] * len(batch)
+    messages, output_model = _build_description_messages(batch)
 
     try:
         response = await asyncio.wait_for(
-            ainvoke(Stage.ROADMAP_PLACE_DETAIL, messages, timeout_seconds=timeout_seconds),
+            ainvoke(
+                Stage.ROADMAP_PLACE_DETAIL,
+                messages,
+                timeout_seconds=timeout_seconds,
+                response_format=json_schema_response_format(output_model),
+            ),
             timeout=wait_timeout_seconds,
         )
     except asyncio.TimeoutError:
         logger.error(
-            "Place description LLM timed out: per_call_timeout=%s wait_timeout=%s",
+            "Place description LLM timed out: per_call_timeout=%s wait_timeout=%s batch_size=%d",
             timeout_seconds,
             wait_timeout_seconds,
+            len(batch),
         )
-        return _apply_fallback()
+        return failed
     except Exception:
-        logger.exception("Place description LLM call failed")
-        return _apply_fallback()
+        logger.exception("Place description LLM call failed: batch_size=%d", len(batch))
+        return failed
 
     try:
         content = strip_code_fence(response.content)
-        detail_plan = parser.parse(content)
+        parsed = output_model.model_validate_json(content)
     except Exception:
-        logger.exception("Place description parse failed")
-        return _apply_fallback()
+        logger.exception("Place description parse failed: batch_size=%d", len(batch))
+        return failed
+
+    if isinstance(parsed, PlaceDetailPlan):
+        return [parsed]
+
+    results = failed[:]
+    for item in parsed.requests:
+        if 0 <= item.request_id < len(batch):
+            results[item.request_id] = PlaceDetailPlan(days=item.days)
+    return results
+
+
+async def _request_place_details(batch: list[list[dict]]) -> list[PlaceDetailPlan | None]:
+    """묶음 호출 후 결과를 받지 못한 요청만 개별 호출로 다시 시도합니다.
+
+    묶음 호출 하나가 실패해도 함께 묶인 다른 사용자의 요청이 모두 기본 문구로 떨어지지 않게 합니다.
+    """
+    results = await _invoke_place_details(batch)
+    if len(batch) == 1:
+        return results
+
+    missing = [index for index, result in enumerate(results) if result is None]
+    if missing:
+        logger.warning(
+            "Place description batch incomplete, retrying individually: batch_size=%d missing=%d",
+            len(batch),
+            len(missing),
+        )
+        retried = await asyncio.gather(*(_invoke_place_details([batch[index]]) for index in missing))
+        for index, (result,) in zip(missing, retried, strict=True):
+            results[index] = result
+    return results
+
+
+_PLACE_DETAIL_BATCHERS: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, MicroBatcher[list[dict], PlaceDetailPlan]
+] = weakref.WeakKeyDictionary()
+
+
+def _get_place_detail_batcher() -> MicroBatcher[list[dict], PlaceDetailPlan]:
+    """실행 중인 이벤트 루프마다 별도의 배처를 반환합니다.
+
+    대기 목록과 타이머는 생성한 루프에 묶이므로 루프 사이에 공유하지 않습니다.
+    """
+    loop = asyncio.get_running_loop()
+    batcher = _PLACE_DETAIL_BATCHERS.get(loop)
+    if batcher is None:
+        settings = get_settings()
+        batcher = MicroBatcher(
+            _request_place_details,
+            max_batch_size=settings.ROADMAP_PLACE_DETAIL_BATCH_MAX_SIZE,
+            window_seconds=settings.ROADMAP_PLACE_DETAIL_BATCH_WINDOW_MS / 1000,
+        )
+        _PLACE_DETAIL_BATCHERS[loop] = batcher
+    return batcher
+
+
+@lru_cache(maxsize=1)
+def _get_description_cache() -> TTLCache[tuple[str, str], str]:
+    settings = get_settings()
+    return TTLCache(
+        max_size=settings.ROADMAP_PLACE_DESCRIPTION_CACHE_MAX_SIZE,
+        ttl_seconds=settings.ROADMAP_PLACE_DESCRIPTION_CACHE_TTL_SECONDS,
+    )
+
+
+def _normalize_cache_text(value: Any) -> str:
+    return " ".join(str(value or "").split()).lower()
+
+
+def _description_cache_key(place: dict) -> tuple[str, str] | None:
+    """place_id가 있으면 place_id로, 없으면 장소명과 주소로 캐시 키를 만듭니다.
+
+    이름만으로는 다른 지역의 동명 장소(예: 중앙시장)가 설명을 공유하므로 주소가 없으면 캐시하지 않습니다.
+    """
+    place_id = str(place.get("place_id") or "").strip()
+    if place_id:
+        return (place_id, _DESCRIPTION_CACHE_VERSION)
+    place_name = _normalize_cache_text(place.get("place_name"))
+    address = _normalize_cache_text(place.get("address"))
+    if place_name and address:
+        return (f"name:{place_name}|{address}", _DESCRIPTION_CACHE_VERSION)
+    return None
+
+
+async def _fill_place_descriptions_with_llm(daily_places: list[dict]) -> list[dict]:
+    """LLM을 통해 장소 description을 채웁니다. 캐시된 장소는 LLM 입력에서 제외합니다."""
+    if not any(day.get("places") for day in daily_places):
+        return _apply_fallback_descriptions(daily_places)
+
+    cache = _get_description_cache()
+    cache_keys = {
+        cache_key
+        for day in daily_places
+        for place in day.get("places", [])
+        if (cache_key := _description_cache_key(place)) is not None
+    }
+    cached_descriptions = cache.get_many(cache_keys)
+
+    input_days = _build_description_input_days(daily_places, set(cached_descriptions))
+    descriptions_by_day: dict[int, dict[int, str]] = {}
+    if input_days:
+        detail_plan = await _get_place_detail_batcher().submit(input_days)
+        if detail_plan is not None:
+            for detail_day in detail_plan.days:
+                day_descriptions = descriptions_by_day.setdefault(detail_day.day_number, {})
+                for slot in detail_day.places:
+                    description = (slot.description or "").strip()
+                    if description:
+                        day_descriptions[slot.visit_sequence] = description
 
-    detail_map = {(day.day_number, slot.visit_sequence): slot for day in detail_plan.days for slot in day.places}
     for day in daily_places:
-        day_number = day.get("day_number")
+        day_descriptions = descriptions_by_day.get(day.get("day_number"), {})
         for place in day.get("places", []):
-            key = (day_number, place.get("visit_sequence"))
-            detail = detail_map.get(key)
-            description = (detail.description or "").strip() if detail else ""
+            cache_key = _description_cache_key(place)
+            if cache_key in cached_descriptions:
+                place["description"] = cached_descriptions[cache_key]
+                continue
+            description = day_descriptions.get(place.get("visit_sequence"), "")
+            if description and cache_key is not None:
+                cache.set(cache_key, description)
             place["description"] = description or _fallback_description(place)
 
     return daily_places
 
 
-async def _apply_visit_time_for_daily_places(
+def _apply_visit_time_for_daily_places(
     daily_places: list[dict],
     planning_preference: PlanningPreference,
+    proposals: dict[int, dict[int, str]],
 ) -> list[dict]:
-    """공용 정책 엔진으로 visit_time을 확정합니다."""
+    """미리 받은 LLM 제안과 공용 정책 엔진으로 visit_time을 확정합니다."""
     output_mode = (
         VisitTimeOutputMode.HHMM
         if planning_preference == PlanningPreference.PLANNED
         else VisitTimeOutputMode.SECTION_EN
     )
     policy_config = build_visit_time_policy_config()
-    proposals = await propose_visit_times_for_days(daily_places, stage=Stage.CHAT_VISIT_TIME)
     warnings: list[str] = []
 
     for day in daily_places:
@@ -267,63 +473,51 @@ async def synthesize_final_roadmap(state: RoadmapState) -> RoadmapState:
         return state
 
     try:
-        itinerary_context, daily_places = _prepare_final_context(state)
-        course_request = CourseRequest.model_validate(state["course_request"])
-        daily_places = await _fill_place_descriptions_with_llm(daily_places)
-        daily_places = await _apply_visit_time_for_daily_places(
+        itinerary_context, daily_places, course_request = _prepare_final_context(state)
+        # description 작성과 visit_time 제안을 동시에 요청합니다. description 작성이 장소 dict를 고치므로
+        # visit_time 제안에는 실행 순서와 무관하도록 장소별 사본을 넘깁니다.
+        visit_time_input = [{**day, "places": [dict(place) for place in day.get("places", [])]} for day in daily_places]
+        visit_time_proposals = propose_visit_times_for_days(visit_time_input, stage=Stage.CHAT_VISIT_TIME)
+        use_fallback_descriptions = (
+            get_settings().ROADMAP_UNPLANNED_FALLBACK_DESCRIPTIONS
+            and course_request.planning_preference != PlanningPreference.PLANNED
+        )
+        if not use_fallback_descriptions:
+            daily_places, proposals = await asyncio.gather(
+                _fill_place_descriptions_with_llm(daily_places),
+                visit_time_proposals,
+            )
+        else:
+            daily_places = _apply_fallback_descriptions(daily_places)
+            proposals = await visit_time_proposals
+        daily_places = _apply_visit_time_for_daily_places(
             daily_places,
             course_request.planning_preference,
+            proposals,
         )
 
-        course_request_payload = course_request.model_dump(mode="json")
-        course_request_payload.pop("budget_range", None)
-
-        parser = PydanticOutputParser(pydantic_object=CourseResponseLLMOutput)
-
-        system_prompt = (
-            "당신은 전문 여행 플래너입니다. 주어진 여행 정보와 확정된 장소 목록을 바탕으로 "
-            "사용자를 위한 최종 여행 로드맵을 완성하는 역할을 합니다\n"
-            "창의적인 여행 제목과 매력적인 코스가 사용자에게 전달될 수 있도록 설명을 포함하세요\n"
-            "출력은 반드시 제공된 JSON 스키마를 엄격히 따라야 합니다"
-        )
-        human_prompt_template = (
-            "## 사용자 요청\n"
-            "{course_request}\n\n"
-            "## 확정된 일자별 장소 목록\n"
-            "{itinerary_context}\n\n"
-            "## 생성 작업 가이드\n"
-            "1. '사용자 요청'을 참고하여 전체 여행을 아우르는 창의적이고 매력적인 `title`을 생성해주세요. "
-            "(반드시 한국어로 작성하되 10자 이내로 간결히 작성하고, 여행지 또는 도시명을 포함해주세요)\n"
-            "2. 로드맵을 한 줄로 요약한 `summary`를 한국어로 작성해주세요. (1문장)\n"
-            "3. 전체 일정에서 연상되는 핵심 키워드 3~5개를 `tags`에 한국어로 작성해주세요.\n"
-            "4. 사용자 요청과 확정된 장소 목록을 모두 고려하여 왜 이 코스가 사용자에게 최적인지 "
-            "설명하는 `llm_commentary`를 작성해주세요. (2-3문장)\n"
-            "5. 사용자가 바로 입력할 수 있는 다음 행동 문장을 `next_action_suggestion` JSON 배열로 작성해주세요. "
-            "(2~3개, 반드시 우리 시스템이 가능한 작업만 포함해야 합니다. "
-            "가능한 작업: 로드맵 생성/재생성/일정 조정 요청, 로드맵 내용에 대한 질문. "
-            "불가능한 작업: 숙소/항공/렌터카/티켓 예약, 결제, 구매, 환전, 보험, 외부 서비스 연동. "
-            "예시 문장은 그대로 출력하지 마세요.)\n\n"
-            "## 출력 형식\n"
-            "{format_instructions}"
-        )
+        course_request_payload = course_request.model_dump(mode="json", exclude={"budget_range"})
 
-        prompt = ChatPromptTemplate.from_messages([("system", system_prompt), ("human", human_prompt_template)])
-        messages = prompt.format_messages(
-            course_request=course_request_payload,
+        messages = _SUMMARY_PROMPT.format_messages(
+            course_request=_to_prompt_json(course_request_payload),
             itinerary_context=itinerary_context,
-            format_instructions=parser.get_format_instructions(),
         )
 
         timeout_seconds = get_timeout_policy().llm_timeout_seconds
-        wait_timeout_seconds = _fallback_grace_timeout(timeout_seconds)
+        wait_timeout_seconds = fallback_grace_timeout(timeout_seconds)
         response = await asyncio.wait_for(
-            ainvoke(Stage.ROADMAP_SUMMARY, messages, timeout_seconds=timeout_seconds),
+            ainvoke(
+                Stage.ROADMAP_SUMMARY,
+                messages,
+                timeout_seconds=timeout_seconds,
+                response_format=json_schema_response_format(CourseResponseLLMOutput),
+            ),
             timeout=wait_timeout_seconds,
         )
         content = strip_code_fence(response.content)
 
         trip_days = state["trip_days"]
-        llm_output = parser.parse(content).model_dump()
+        llm_output = CourseResponseLLMOutput.model_validate_json(content).model_dump()
         llm_output["next_action_suggestion"] = _safe_next_action_suggestions(trip_days)
 
         final_roadmap = {
@@ -336,8 +530,8 @@ async def synthesize_final_roadmap(state: RoadmapState) -> RoadmapState:
             "itinerary": daily_places,
         }
 
-        return {**state, "final_roadmap": final_roadmap}
+        return {"final_roadmap": final_roadmap}
 
     except Exception as exc:
         logger.error("최종 로드맵 생성 실패: %s", exc, exc_info=True)
-        return {**state, "error": f"최종 로드맵 생성에 실패했습니다: {exc}"}
+        return {"error": f"최종 로드맵 생성에 실패했습니다: {exc}"}
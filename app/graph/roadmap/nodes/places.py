@@ -3,6 +3,11 @@
 from __future__ import annotations
 
 import asyncio
+import logging
+import re
+from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
 
 from langchain_core.runnables import RunnableConfig
 
@@ -14,8 +19,9 @@ from app.core.timeout_policy import get_timeout_policy
 from app.graph.roadmap.state import RoadmapState
 from app.graph.roadmap.utils import build_search_query, build_slot_key
 from app.schemas.enums import BudgetRange, Region
+from app.schemas.place import PLACE_LIST_ADAPTER
 from app.services.google_places_service import get_google_places_service
-from app.services.place_rerank_service import select_place_ids_for_day
+from app.services.place_rerank_service import select_place_ids_for_day, select_place_ids_for_days
 from app.services.places_service import PlacesServiceProtocol
 
 logger = get_logger(__name__)
@@ -48,26 +54,43 @@ _FOOD_KEYWORD_HINTS = (
     "dessert",
     "brunch",
 )
+_BUDGET_PRICE_LEVELS: dict[str, tuple[str, ...]] = {
+    BudgetRange.LOW.value: ("PRICE_LEVEL_INEXPENSIVE",),
+    BudgetRange.MID.value: ("PRICE_LEVEL_MODERATE",),
+    BudgetRange.HIGH.value: ("PRICE_LEVEL_EXPENSIVE",),
+    BudgetRange.LUXURY.value: ("PRICE_LEVEL_VERY_EXPENSIVE",),
+}
+_SLOT_SEARCH_RESULT_LOG = (
+    "Places search result: slot=%s min_rating_applied=%s candidate_count=%d "
+    "geo_filter_applied=%s geo_filter_scope=%s "
+    "geo_filter_fallback_unfiltered=%s geo_filtered_out_count=%d "
+    "geo_missing_region_bbox=%s fallback_stage=%s "
+    "restriction_used=%s bias_used=%s unfiltered_used=%s"
+)
+_RERANK_RESULT_LOG = (
+    "Roadmap place rerank result: flow=roadmap day_count=%d batch_size=%d selected=%d missed=%d "
+    "fallback_used=%s multi_day_failed=%s"
+)
+_FOOD_KEYWORD_EXACT = frozenset(hint.lower() for hint in _FOOD_KEYWORD_HINTS)
+_FOOD_KEYWORD_PATTERN = re.compile("|".join(re.escape(hint.lower()) for hint in _FOOD_KEYWORD_HINTS))
 
 
 def _map_budget_to_price_levels(budget_range: str | BudgetRange | None) -> list[str] | None:
     if not budget_range:
         return None
     value = budget_range.value if isinstance(budget_range, BudgetRange) else str(budget_range)
-    mapping = {
-        BudgetRange.LOW.value: ["PRICE_LEVEL_INEXPENSIVE"],
-        BudgetRange.MID.value: ["PRICE_LEVEL_MODERATE"],
-        BudgetRange.HIGH.value: ["PRICE_LEVEL_EXPENSIVE"],
-        BudgetRange.LUXURY.value: ["PRICE_LEVEL_VERY_EXPENSIVE"],
-    }
-    return mapping.get(value)
+    price_levels = _BUDGET_PRICE_LEVELS.get(value)
+    return list(price_levels) if price_levels else None
 
 
+@lru_cache(maxsize=512)
 def _is_food_keyword(keyword: str) -> bool:
     normalized = (keyword or "").strip().lower()
     if not normalized:
         return False
-    return any(hint in normalized for hint in _FOOD_KEYWORD_HINTS)
+    if normalized in _FOOD_KEYWORD_EXACT:
+        return True
+    return _FOOD_KEYWORD_PATTERN.search(normalized) is not None
 
 
 def _price_levels_for_slot(slot: dict, base_price_levels: list[str] | None) -> list[str] | None:
@@ -86,22 +109,45 @@ def _move_selected_first(places: list[dict], selected_place_id: str) -> tuple[li
     )
     if selected_index in (None, 0):
         return places, False
-    reordered = [places[selected_index], *places[:selected_index], *places[selected_index + 1 :]]
-    return reordered, True
+    places.insert(0, places.pop(selected_index))
+    return places, True
 
 
 def _hard_filter_by_bbox(places: list, bbox: GeoRectangle) -> tuple[list, int]:
-    filtered = [
-        place
-        for place in places
-        if bbox.contains(
-            place.geometry.latitude,
-            place.geometry.longitude,
-        )
-    ]
+    mask = bbox.contains_many((place.geometry.latitude, place.geometry.longitude) for place in places)
+    filtered = [place for place, inside in zip(places, mask, strict=True) if inside]
     return filtered, max(0, len(places) - len(filtered))
 
 
+async def _rerank_days_individually(
+    days_payload: list[dict],
+    *,
+    max_candidates: int,
+    timeout_seconds: int,
+    max_concurrency: int,
+) -> tuple[dict[str, str], int]:
+    """일자별 재정렬 결과와 재정렬에 실패한 일자 수를 반환합니다. 실패한 일자는 Places 순서를 유지합니다."""
+    rerank_semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def rerank_day(day: dict) -> dict[str, str] | None:
+        async with rerank_semaphore:
+            return await select_place_ids_for_day(
+                day_number=day["day_number"],
+                slots=day["slots"],
+                max_candidates=max_candidates,
+                timeout_seconds=timeout_seconds,
+            )
+
+    selected_map: dict[str, str] = {}
+    failed_day_count = 0
+    for day_selected in await asyncio.gather(*(rerank_day(day) for day in days_payload)):
+        if day_selected is None:
+            failed_day_count += 1
+        else:
+            selected_map.update(day_selected)
+    return selected_map, failed_day_count
+
+
 async def fetch_places_from_slots(
     state: RoadmapState,
     config: RunnableConfig,
@@ -112,7 +158,7 @@ async def fetch_places_from_slots(
 
     skeleton_plan = state.get("skeleton_plan")
     if not skeleton_plan:
-        return {**state, "error": "fetch_places_from_slots에는 skeleton_plan이 필요합니다."}
+        return {"error": "fetch_places_from_slots에는 skeleton_plan이 필요합니다."}
 
     places_service: PlacesServiceProtocol | None = config.get("configurable", {}).get("places_service")
     if places_service is None:
@@ -120,7 +166,7 @@ async def fetch_places_from_slots(
             places_service = get_google_places_service()
         except Exception as exc:
             logger.error("PlacesService initialization failed: %s", exc)
-            return {**state, "error": "PlacesService가 주입되지 않았습니다."}
+            return {"error": "PlacesService가 주입되지 않았습니다."}
 
     raw_request = state.get("course_request") or {}
     if isinstance(raw_request, dict):
@@ -133,23 +179,63 @@ async def fetch_places_from_slots(
     min_rating = settings.GOOGLE_PLACES_MIN_RATING
     rerank_enabled = settings.GOOGLE_PLACES_LLM_RERANK_ENABLED
     rerank_max_candidates = settings.GOOGLE_PLACES_LLM_RERANK_MAX_CANDIDATES
-    rerank_timeout_seconds = get_timeout_policy(settings).llm_timeout_seconds
+    # 리랭크 시에는 후보 상한만큼만 받아 버려질 결과의 직렬화를 줄입니다.
+    search_max_results = rerank_max_candidates if rerank_enabled else None
+    timeout_policy = get_timeout_policy(settings)
+    rerank_timeout_seconds = timeout_policy.llm_timeout_seconds
+    search_timeout_seconds = timeout_policy.google_places_timeout_seconds
+    search_semaphore = asyncio.Semaphore(settings.GOOGLE_PLACES_MAX_CONCURRENCY)
 
     fetched_places: dict[str, list] = {}
 
-    tasks: list[tuple[str, str, list[str] | None, Region | str | None]] = []
-    for day in skeleton_plan:
+    # (일자 위치, day_number, slot_key, slot)을 한 번만 펼쳐 검색과 리랭크 단계에서 함께 씁니다.
+    flat_slots: list[tuple[int, int, str, dict]] = []
+    for day_index, day in enumerate(skeleton_plan):
         day_number = day.get("day_number", 0)
-        day_region = day.get("region")
-        slots = day.get("slots", [])
-        for slot_index, slot in enumerate(slots):
-            slot_key = build_slot_key(day_number, slot_index)
-            query = build_search_query(slot)
-            if query:
-                slot_price_levels = _price_levels_for_slot(slot, base_price_levels)
-                tasks.append((slot_key, query, slot_price_levels, day_region))
-            else:
-                fetched_places[slot_key] = []
+        flat_slots.extend(
+            (day_index, day_number, build_slot_key(day_number, slot_index), slot)
+            for slot_index, slot in enumerate(day.get("slots", []))
+        )
+
+    tasks: list[tuple[str, str, list[str] | None, Region | str | None]] = []
+    for day_index, _, slot_key, slot in flat_slots:
+        query = build_search_query(slot)
+        if query:
+            slot_price_levels = _price_levels_for_slot(slot, base_price_levels)
+            tasks.append((slot_key, query, slot_price_levels, skeleton_plan[day_index].get("region")))
+        else:
+            fetched_places[slot_key] = []
+
+    search_calls: dict[tuple, asyncio.Future] = {}
+
+    async def search_places(
+        query: str,
+        *,
+        price_levels: list[str] | None,
+        min_rating: float | None,
+        location_restriction: GeoRectangle | None,
+        location_bias: GeoRectangle | None,
+    ) -> list:
+        # 슬롯 간 폴백 단계에서 같은 조건의 호출이 겹치면 이 요청 안에서 결과를 공유합니다.
+        # 호출 전체 시간(커넥션 풀 대기 + 응답 수신)은 Places 타임아웃으로 제한합니다.
+        call_key = (query, tuple(price_levels or ()), min_rating, location_restriction, location_bias)
+        call = search_calls.get(call_key)
+        if call is None:
+            call = asyncio.ensure_future(
+                asyncio.wait_for(
+                    places_service.search(
+                        query,
+                        price_levels=price_levels,
+                        min_rating=min_rating,
+                        location_restriction=location_restriction,
+                        location_bias=location_bias,
+                        max_results=search_max_results,
+                    ),
+                    timeout=search_timeout_seconds,
+                )
+            )
+            search_calls[call_key] = call
+        return await call
 
     async def search_for_slot(
         slot_key: str,
@@ -170,8 +256,10 @@ async def fetch_places_from_slots(
         if region_bbox is None:
             geo_missing_region_bbox = True
 
+        # Text Search는 한 요청에 여러 단계의 조건을 받지 않으므로 폴백은 순서대로 호출합니다.
+        # 대신 앞 단계와 같은 조건은 건너뛰고, 슬롯 간 같은 조건 호출은 search_places에서 공유합니다.
         try:
-            places = await places_service.search(
+            places = await search_places(
                 query,
                 price_levels=price_levels,
                 min_rating=min_rating,
@@ -186,7 +274,7 @@ async def fetch_places_from_slots(
             if not places and region_bbox is not None:
                 fallback_stage = "bias"
                 bias_used = True
-                places = await places_service.search(
+                places = await search_places(
                     query,
                     price_levels=price_levels,
                     min_rating=min_rating,
@@ -200,7 +288,7 @@ async def fetch_places_from_slots(
             if not places and region_bbox is not None and price_levels:
                 fallback_stage = "bias_without_price_levels"
                 bias_used = True
-                places = await places_service.search(
+                places = await search_places(
                     query,
                     price_levels=None,
                     min_rating=min_rating,
@@ -211,11 +299,12 @@ async def fetch_places_from_slots(
                     places, filtered_out = _hard_filter_by_bbox(places, region_bbox)
                     geo_filtered_out_count += filtered_out
 
-            if not places:
+            # 직전 단계와 같은 조건의 재검색은 결과도 같으므로 건너뜁니다.
+            if not places and (region_bbox is not None or price_levels):
                 fallback_stage = "unfiltered_with_min_rating"
                 geo_filter_fallback_unfiltered = True
                 unfiltered_used = True
-                places = await places_service.search(
+                places = await search_places(
                     query,
                     price_levels=None,
                     min_rating=min_rating,
@@ -223,11 +312,11 @@ async def fetch_places_from_slots(
                     location_bias=None,
                 )
 
-            if not places:
+            if not places and min_rating is not None:
                 fallback_stage = "unfiltered_without_min_rating"
                 geo_filter_fallback_unfiltered = True
                 unfiltered_used = True
-                places = await places_service.search(
+                places = await search_places(
                     query,
                     price_levels=None,
                     min_rating=None,
@@ -235,109 +324,133 @@ async def fetch_places_from_slots(
                     location_bias=None,
                 )
 
-            logger.info(
-                (
-                    "Places search result: slot=%s min_rating_applied=%s candidate_count=%d "
-                    "geo_filter_applied=%s geo_filter_scope=%s "
-                    "geo_filter_fallback_unfiltered=%s geo_filtered_out_count=%d "
-                    "geo_missing_region_bbox=%s fallback_stage=%s "
-                    "restriction_used=%s bias_used=%s unfiltered_used=%s"
-                ),
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    _SLOT_SEARCH_RESULT_LOG,
+                    slot_key,
+                    min_rating is not None,
+                    len(places),
+                    region_bbox is not None,
+                    geo_filter_scope,
+                    geo_filter_fallback_unfiltered,
+                    geo_filtered_out_count,
+                    geo_missing_region_bbox,
+                    fallback_stage,
+                    restriction_used,
+                    bias_used,
+                    unfiltered_used,
+                )
+            return slot_key, PLACE_LIST_ADAPTER.dump_python(places)
+        except asyncio.TimeoutError:
+            logger.warning(
+                "Slot place search timed out: slot=%s stage=%s timeout=%s",
                 slot_key,
-                min_rating is not None,
-                len(places),
-                region_bbox is not None,
-                geo_filter_scope,
-                geo_filter_fallback_unfiltered,
-                geo_filtered_out_count,
-                geo_missing_region_bbox,
                 fallback_stage,
-                restriction_used,
-                bias_used,
-                unfiltered_used,
+                search_timeout_seconds,
             )
-            return slot_key, [place.model_dump() for place in places]
+            return slot_key, []
         except Exception as exc:
             logger.warning("Slot place search failed: slot=%s error=%s", slot_key, exc)
             return slot_key, []
 
-    results = await asyncio.gather(
-        *[search_for_slot(key, query, levels, region) for key, query, levels, region in tasks]
-    )
+    async def bounded_search_for_slot(
+        slot_key: str,
+        query: str,
+        price_levels: list[str] | None,
+        region: Region | str | None,
+    ) -> tuple[str, list]:
+        async with search_semaphore:
+            return await search_for_slot(slot_key, query, price_levels, region)
 
-    for slot_key, places in results:
-        fetched_places[slot_key] = places
+    # 같은 검색 조건(공백·대소문자 차이 무시)의 슬롯은 한 번만 조회하고
+    # 결과를 슬롯별 목록으로 복사해 나눠 줍니다.
+    search_keys = [
+        (" ".join(query.split()).lower(), tuple(levels or ()), str(region)) for _, query, levels, region in tasks
+    ]
+    unique_tasks: dict[tuple[str, tuple[str, ...], str], tuple[str, str, list[str] | None, Region | str | None]] = {}
+    slot_keys_by_search: dict[tuple[str, tuple[str, ...], str], list[str]] = {}
+    for task, search_key in zip(tasks, search_keys, strict=True):
+        unique_tasks.setdefault(search_key, task)
+        slot_keys_by_search.setdefault(search_key, []).append(task[0])
+
+    async def search_unique(
+        search_key: tuple[str, tuple[str, ...], str],
+        task: tuple[str, str, list[str] | None, Region | str | None],
+    ) -> tuple[tuple[str, tuple[str, ...], str], list]:
+        _, places = await bounded_search_for_slot(*task)
+        return search_key, places
+
+    # 끝난 검색부터 해당 슬롯들에 바로 채워 넣습니다.
+    for completed in asyncio.as_completed(
+        [search_unique(search_key, task) for search_key, task in unique_tasks.items()]
+    ):
+        search_key, places = await completed
+        for slot_key in slot_keys_by_search[search_key]:
+            fetched_places[slot_key] = list(places)
 
     if rerank_enabled:
-
-        async def rerank_for_day(day: dict) -> None:
-            day_number = day.get("day_number", 0)
+        days_payload: list[dict] = []
+        reranked_slot_keys: list[str] = []
+        for (_, day_number), day_slots in groupby(flat_slots, key=itemgetter(0, 1)):
             slots_payload: list[dict] = []
-            for slot_index, slot in enumerate(day.get("slots", [])):
-                slot_key = build_slot_key(day_number, slot_index)
+            for _, _, slot_key, slot in day_slots:
                 candidates = fetched_places.get(slot_key, [])
                 if not candidates:
                     continue
+                rerank_candidates = candidates[:rerank_max_candidates]
+                reranked_slot_keys.append(slot_key)
                 slots_payload.append(
                     {
                         "slot_key": slot_key,
                         "section": slot.get("section"),
                         "area": slot.get("area"),
                         "keyword": slot.get("keyword"),
-                        "candidates": candidates[:rerank_max_candidates],
+                        "candidates": rerank_candidates,
                     }
                 )
+            if slots_payload:
+                days_payload.append({"day_number": day_number, "slots": slots_payload})
 
-            if not slots_payload:
-                return
-
-            selected_map = await select_place_ids_for_day(
-                day_number=day_number,
-                slots=slots_payload,
+        if days_payload:
+            # 출력 길이가 일수에 비례하므로 일괄 호출의 타임아웃도 일수만큼 늘립니다.
+            selected_map = await select_place_ids_for_days(
+                days=days_payload,
                 max_candidates=rerank_max_candidates,
-                timeout_seconds=rerank_timeout_seconds,
+                timeout_seconds=rerank_timeout_seconds * len(days_payload),
             )
+            # fallback_used는 재정렬 없이 Places 순서를 그대로 쓴 일자가 있는지를 뜻합니다.
+            multi_day_failed = selected_map is None
+            fallback_used = False
             if selected_map is None:
-                logger.info(
-                    (
-                        "Roadmap place rerank result: flow=roadmap day=%s "
-                        "batch_size=%d selected=0 missed=%d fallback_used=true"
-                    ),
-                    day_number,
-                    len(slots_payload),
-                    len(slots_payload),
+                # 일괄 호출이 실패하면 일자별로 다시 재정렬해, 응답 하나의 실패가 전체 일정의 재정렬을 막지 않게 합니다.
+                selected_map, failed_day_count = await _rerank_days_individually(
+                    days_payload,
+                    max_candidates=rerank_max_candidates,
+                    timeout_seconds=rerank_timeout_seconds,
+                    max_concurrency=settings.GOOGLE_PLACES_LLM_RERANK_MAX_CONCURRENCY,
                 )
-                return
+                fallback_used = failed_day_count > 0
 
             selected_count = 0
             missed_count = 0
-            for slot in slots_payload:
-                slot_key = slot["slot_key"]
+            for slot_key in reranked_slot_keys:
                 selected_place_id = selected_map.get(slot_key)
                 if not selected_place_id:
                     missed_count += 1
                     continue
                 selected_count += 1
-                original_places = fetched_places.get(slot_key, [])
-                reordered_places, _ = _move_selected_first(original_places, selected_place_id)
-                fetched_places[slot_key] = reordered_places
+                fetched_places[slot_key], _ = _move_selected_first(fetched_places[slot_key], selected_place_id)
 
             logger.info(
-                (
-                    "Roadmap place rerank result: flow=roadmap day=%s "
-                    "batch_size=%d selected=%d missed=%d fallback_used=false"
-                ),
-                day_number,
-                len(slots_payload),
+                _RERANK_RESULT_LOG,
+                len(days_payload),
+                len(reranked_slot_keys),
                 selected_count,
                 missed_count,
+                "true" if fallback_used else "false",
+                "true" if multi_day_failed else "false",
             )
 
-        await asyncio.gather(*[rerank_for_day(day) for day in skeleton_plan])
-
     logger.info("Slot place fetch completed: slot_count=%d", len(fetched_places))
 
-    return {
-        **state,
-        "fetched_places": fetched_places,
-    }
+    return {"fetched_places": fetched_places}
@@ -2,6 +2,7 @@
 
 from typing import TypedDict
 
+from app.schemas.course import CourseRequest
 from app.schemas.enums import Region
 
 
@@ -25,7 +26,7 @@ class RoadmapState(TypedDict, total=False):
     """로드맵 생성 그래프 상태.
 
     Keys:
-        course_request: 요청 페이로드
+        course_request: 요청 페이로드(검증된 CourseRequest 또는 dict)
         trip_days: 여행 일수
         slot_min: 슬롯 최소 개수
         slot_max: 슬롯 최대 개수
@@ -36,7 +37,7 @@ class RoadmapState(TypedDict, total=False):
         error: 오류 메시지
     """
 
-    course_request: dict
+    course_request: CourseRequest | dict
     trip_days: int
     slot_min: int
     slot_max: int
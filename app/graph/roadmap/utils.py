@@ -1,25 +1,44 @@
 """로드맵 그래프 공통 유틸리티."""
 
+from functools import lru_cache
+
+_CODE_FENCE = "```"
+
 
 def strip_code_fence(text: str) -> str:
-    """코드 펜스를 제거합니다."""
+    """코드 펜스를 제거합니다.
+
+    첫 번째 펜스 구간만 필요하므로 전체를 분할하지 않고 닫는 펜스 위치까지만 잘라냅니다.
+    """
     content = (text or "").strip()
-    if content.startswith("```"):
-        parts = content.split("```")
-        if len(parts) > 1:
-            content = parts[1].strip()
-            if content.startswith("json"):
-                content = content[4:].strip()
+    if not content.startswith(_CODE_FENCE):
+        return content
+    start = len(_CODE_FENCE)
+    end = content.find(_CODE_FENCE, start)
+    content = (content[start:] if end < 0 else content[start:end]).strip()
+    if content.startswith("json"):
+        content = content[4:]
     return content.strip()
 
 
+@lru_cache(maxsize=4096)
 def build_slot_key(day_number: int, slot_index: int) -> str:
-    """슬롯 키를 생성합니다."""
+    """슬롯 키를 생성합니다.
+
+    같은 슬롯 키를 장소 조회와 최종 정리 단계에서 반복 생성하므로 결과 문자열을 재사용합니다.
+    """
     return f"day{day_number}_slot{slot_index}"
 
 
 def build_search_query(slot: dict) -> str:
-    """슬롯 정보로 검색어를 구성합니다."""
+    """슬롯 정보로 검색어를 구성합니다.
+
+    한쪽이 비어 있으면 결합 문자열을 만들지 않고 남은 값을 그대로 반환합니다.
+    """
     area = slot.get("area", "").strip()
     keyword = slot.get("keyword", "").strip()
-    return f"{area} {keyword}".strip()
+    if not area:
+        return keyword
+    if not keyword:
+        return area
+    return f"{area} {keyword}"
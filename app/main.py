@@ -25,6 +25,9 @@ logger = get_logger(__name__)
 settings = get_settings()
 timeout_policy = get_timeout_policy(settings)
 
+# 수정된 일정 없이 응답하는 채팅 예시 키 목록입니다.
+_CHAT_NULL_ITINERARY_EXAMPLES = ("rejected_guardrail", "general_chat", "ask_clarification")
+
 
 def _split_csv(value: str) -> list[str]:
     return [item.strip() for item in value.split(",") if item.strip()]
@@ -133,17 +136,12 @@ async def unhandled_exception_handler(request: Request, exc: Exception) -> JSONR
 
 def _inject_chat_null_examples(openapi_schema: dict) -> None:
     """`/api/v1/chat` 응답 예시에 `modified_itinerary: null` 키를 강제 주입합니다."""
-    content = (
-        openapi_schema.get("paths", {})
-        .get("/api/v1/chat", {})
-        .get("post", {})
-        .get("responses", {})
-        .get("200", {})
-        .get("content", {})
-        .get("application/json", {})
-    )
-    examples = content.get("examples", {})
-    for example_key in ("rejected_guardrail", "general_chat", "ask_clarification"):
+    try:
+        chat_response = openapi_schema["paths"]["/api/v1/chat"]["post"]["responses"]["200"]
+        examples = chat_response["content"]["application/json"]["examples"]
+    except KeyError:
+        return
+    for example_key in _CHAT_NULL_ITINERARY_EXAMPLES:
         value = examples.get(example_key, {}).get("value")
         if isinstance(value, dict):
             value.setdefault("modified_itinerary", None)
@@ -138,4 +138,3 @@ class CourseResponseLLMOutput(BaseModel):
     summary: str = Field(..., description="로드맵 한 줄 설명")
     tags: list[str] = Field(..., description="여행 전체를 요약하는 3~5개의 키워드 태그")
     llm_commentary: str = Field(..., description="코스 선정 이유 및 전체 흐름 설명")
-    next_action_suggestion: list[str] = Field(..., description="사용자가 바로 입력할 수 있는 다음 행동 문장 목록")
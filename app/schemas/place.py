@@ -1,6 +1,6 @@
 """Google Places API 응답을 표준화하여 저장할 Place 모델."""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 
 class PlaceGeometry(BaseModel):
@@ -19,3 +19,7 @@ class Place(BaseModel):
     geometry: PlaceGeometry = Field(..., description="장소 좌표 정보")
     url: str | None = Field(default=None, description="구글 맵 URL")
     types: list[str] = Field(default_factory=list, description="장소 유형 목록")
+
+
+# Place 목록을 항목별 호출 없이 한 번에 검증/직렬화합니다.
+PLACE_LIST_ADAPTER = TypeAdapter(list[Place])
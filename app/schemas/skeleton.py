@@ -2,7 +2,7 @@
 
 from typing import List
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 from app.schemas.enums import Region
 
@@ -24,6 +24,10 @@ class SlotIntent(BaseModel):
     )
 
 
+# 일자별 슬롯 목록을 항목별 호출 없이 한 번에 직렬화합니다.
+SLOT_INTENT_LIST_ADAPTER = TypeAdapter(list[SlotIntent])
+
+
 class DayPlan(BaseModel):
     """일자별 스켈레톤 플랜."""
 
@@ -32,6 +36,10 @@ class DayPlan(BaseModel):
     slots: List[SlotIntent] = Field(..., description="해당 일자의 슬롯 의도 목록(순서 유지).")
 
 
+# 스켈레톤 일자 목록을 SkeletonPlan 래퍼 없이 한 번에 직렬화합니다.
+DAY_PLAN_LIST_ADAPTER = TypeAdapter(list[DayPlan])
+
+
 class SkeletonPlan(BaseModel):
     """전체 여행 스켈레톤 플랜."""
 
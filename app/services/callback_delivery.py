@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+from functools import lru_cache
 from typing import Any
 
 import requests
@@ -14,6 +15,16 @@ from app.core.timeout_policy import to_requests_timeout
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _get_callback_session() -> requests.Session:
+    """콜백 전송에 재사용할 프로세스 단위 세션을 반환합니다.
+
+    콜백은 매번 같은 백엔드로 전송되므로 keep-alive 연결을 재사용해 요청마다 반복되던
+    TCP/TLS 핸드셰이크로 작업 스레드가 묶이는 시간을 줄입니다.
+    """
+    return requests.Session()
+
+
 def _is_retryable_request_error(exc: Exception) -> bool:
     """재시도 가능한 요청 예외인지 판별합니다."""
     if isinstance(exc, (requests.Timeout, requests.ConnectionError)):
@@ -46,7 +57,7 @@ async def post_callback_with_retry(
     for attempt in range(1, max_attempts + 1):
 
         def _send() -> requests.Response:
-            return requests.post(
+            return _get_callback_session().post(
                 callback_url,
                 json=payload,
                 headers=headers,
@@ -19,7 +19,8 @@ logger = get_logger(__name__)
 
 async def run_roadmap_pipeline(request: CourseRequest) -> CourseResponse:
     """로드맵 그래프를 실행하고 결과를 반환합니다."""
-    initial_state = {"course_request": request.model_dump(mode="json")}
+    # FastAPI에서 이미 검증된 모델을 그대로 넘겨 노드마다 dict를 다시 검증하지 않게 합니다.
+    initial_state = {"course_request": request}
     places_service = get_google_places_service()
     result = await compiled_roadmap_graph.ainvoke(
         initial_state,
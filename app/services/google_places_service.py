@@ -3,16 +3,20 @@
 from __future__ import annotations
 
 import asyncio
+import json
+import weakref
 from functools import lru_cache
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from app.core.config import get_settings
 from app.core.geo import GeoRectangle
 from app.core.logger import get_logger
 from app.core.timeout_policy import get_timeout_policy, to_requests_timeout
-from app.schemas.place import Place, PlaceGeometry
+from app.core.ttl_cache import TTLCache
+from app.schemas.place import PLACE_LIST_ADAPTER, Place
 from app.services.places_service import PlacesServiceProtocol
 
 logger = get_logger(__name__)
@@ -39,6 +43,10 @@ class GooglePlacesService(PlacesServiceProtocol):
         timeout_seconds: int = 10,
         page_size: int = 5,
         language_code: str = "ko",
+        pool_size: int = 16,
+        max_concurrency: int = 16,
+        empty_result_cache_ttl_seconds: float = 0,
+        empty_result_cache_max_size: int = 10000,
     ) -> None:
         if not api_key:
             raise GooglePlacesError("GOOGLE_PLACES_API_KEY is not configured.")
@@ -46,10 +54,35 @@ class GooglePlacesService(PlacesServiceProtocol):
         self._timeout_seconds = timeout_seconds
         self._page_size = page_size
         self._language_code = language_code.strip() if language_code else ""
+        self._max_concurrency = max(1, int(max_concurrency))
+        # 커넥션 풀이 동시 호출 상한보다 작으면 초과 연결이 버려지므로 풀을 상한 이상으로 잡습니다.
+        self._session = self._build_session(max(int(pool_size), self._max_concurrency))
+        self._call_semaphores: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._inflight_searches: dict[str, asyncio.Task[list[Place]]] = {}
+        self._empty_result_cache: TTLCache[str, bool] | None = None
+        if empty_result_cache_ttl_seconds > 0:
+            self._empty_result_cache = TTLCache(
+                max_size=empty_result_cache_max_size,
+                ttl_seconds=empty_result_cache_ttl_seconds,
+            )
+
+    @staticmethod
+    def _build_session(pool_size: int) -> requests.Session:
+        """keep-alive 연결을 재사용하는 공용 세션을 생성합니다.
+
+        풀이 가득 차도 대기하지 않습니다. 대기하면 기본 실행기 스레드가 무기한 묶이고, 취소된 호출도
+        연결이 생기면 뒤늦게 전송되기 때문입니다. 동시 호출 수는 `_call_semaphore`가 스레드를 잡기 전에 제한합니다.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(1, int(pool_size)))
+        session.mount("https://", adapter)
+        return session
 
     def close(self) -> None:
-        """리소스를 정리합니다(컨텍스트 매니저 대칭성 유지)."""
-        return None
+        """공용 HTTP 세션과 커넥션 풀을 정리합니다."""
+        self._session.close()
 
     def __enter__(self) -> GooglePlacesService:
         return self
@@ -69,6 +102,10 @@ class GooglePlacesService(PlacesServiceProtocol):
             api_key=settings.GOOGLE_PLACES_API_KEY or "",
             timeout_seconds=timeout_seconds,
             language_code=settings.GOOGLE_PLACES_LANGUAGE_CODE,
+            pool_size=settings.GOOGLE_PLACES_MAX_CONCURRENCY,
+            max_concurrency=settings.GOOGLE_PLACES_PROCESS_MAX_CONCURRENCY,
+            empty_result_cache_ttl_seconds=settings.GOOGLE_PLACES_EMPTY_RESULT_CACHE_TTL_SECONDS,
+            empty_result_cache_max_size=settings.GOOGLE_PLACES_EMPTY_RESULT_CACHE_MAX_SIZE,
         )
 
     async def search(
@@ -78,6 +115,7 @@ class GooglePlacesService(PlacesServiceProtocol):
         min_rating: float | None = None,
         location_restriction: GeoRectangle | None = None,
         location_bias: GeoRectangle | None = None,
+        max_results: int | None = None,
     ) -> list[Place]:
         """텍스트 쿼리로 장소를 검색합니다."""
         if not query.strip():
@@ -85,7 +123,8 @@ class GooglePlacesService(PlacesServiceProtocol):
         if location_restriction is not None and location_bias is not None:
             raise ValueError("locationRestriction과 locationBias는 동시에 사용할 수 없습니다.")
 
-        payload: dict[str, Any] = {"textQuery": query, "pageSize": self._page_size}
+        page_size = self._page_size if max_results is None else max(1, min(self._page_size, int(max_results)))
+        payload: dict[str, Any] = {"textQuery": query, "pageSize": page_size}
         if self._language_code:
             payload["languageCode"] = self._language_code
         if min_rating is not None:
@@ -99,6 +138,29 @@ class GooglePlacesService(PlacesServiceProtocol):
         elif location_bias is not None:
             payload["locationBias"] = location_bias.to_google_location_bias_payload()
 
+        # 정상 응답에서 결과가 없었던 요청은 잠시 다시 호출하지 않습니다. API 오류는 캐시하지 않습니다.
+        cache_key = json.dumps(payload, ensure_ascii=False, sort_keys=True)
+        if self._empty_result_cache is not None and self._empty_result_cache.get(cache_key):
+            logger.info("Google Places search skipped: cached empty result")
+            return []
+
+        # 동시에 들어온 동일 검색은 진행 중인 호출 하나를 공유합니다. 결과는 보관하지 않습니다.
+        running_loop = asyncio.get_running_loop()
+        task = self._inflight_searches.get(cache_key)
+        if task is None or task.get_loop() is not running_loop:
+            task = running_loop.create_task(self._search_payload(payload, cache_key))
+            self._inflight_searches[cache_key] = task
+            task.add_done_callback(lambda done: self._forget_inflight_search(cache_key, done))
+        else:
+            logger.debug("Google Places search joined in-flight request")
+        return list(await asyncio.shield(task))
+
+    def _forget_inflight_search(self, cache_key: str, task: asyncio.Task[list[Place]]) -> None:
+        if self._inflight_searches.get(cache_key) is task:
+            del self._inflight_searches[cache_key]
+
+    async def _search_payload(self, payload: dict[str, Any], cache_key: str) -> list[Place]:
+        """검색 요청 한 건을 실행하고 응답을 Place 목록으로 검증합니다."""
         data = await self._request(
             method="POST",
             url=f"{self._BASE_URL}{self._SEARCH_PATH}",
@@ -108,16 +170,20 @@ class GooglePlacesService(PlacesServiceProtocol):
         )
 
         places_raw = (data or {}).get("places", [])
-        places = [place for place in (self._map_place(item) for item in places_raw) if place]
+        places = PLACE_LIST_ADAPTER.validate_python(
+            [item for item in (self._map_place_payload(raw) for raw in places_raw) if item]
+        )
+        if data is not None and not places and self._empty_result_cache is not None:
+            self._empty_result_cache.set(cache_key, True)
         logger.info(
             (
                 "Google Places search completed: min_rating_applied=%s "
                 "geo_filter_applied=%s geo_filter_type=%s geo_bias_applied=%s candidate_count=%d"
             ),
-            min_rating is not None,
-            location_restriction is not None,
-            "bbox" if location_restriction is not None else "none",
-            location_bias is not None,
+            "minRating" in payload,
+            "locationRestriction" in payload,
+            "bbox" if "locationRestriction" in payload else "none",
+            "locationBias" in payload,
             len(places),
         )
         return places
@@ -140,7 +206,20 @@ class GooglePlacesService(PlacesServiceProtocol):
             field_mask=self._DETAILS_FIELD_MASK,
         )
 
-        return self._map_place(data or {})
+        payload = self._map_place_payload(data or {})
+        return Place.model_validate(payload) if payload else None
+
+    def _call_semaphore(self) -> asyncio.Semaphore:
+        """프로세스 전체 Places 동시 호출 수를 제한하는 세마포어를 반환합니다.
+
+        서비스는 프로세스 단위 싱글톤이고 asyncio 세마포어는 루프에 묶이므로 실행 중인 루프별로 만듭니다.
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = self._call_semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self._max_concurrency)
+            self._call_semaphores[loop] = semaphore
+        return semaphore
 
     async def _request(
         self,
@@ -158,18 +237,19 @@ class GooglePlacesService(PlacesServiceProtocol):
         request_timeout = to_requests_timeout(self._timeout_seconds)
 
         def _send() -> requests.Response:
-            with requests.Session() as session:
-                return session.request(
-                    method=method,
-                    url=url,
-                    json=payload,
-                    params=params,
-                    headers=headers,
-                    timeout=request_timeout,
-                )
+            return self._session.request(
+                method=method,
+                url=url,
+                json=payload,
+                params=params,
+                headers=headers,
+                timeout=request_timeout,
+            )
 
         try:
-            response = await asyncio.to_thread(_send)
+            # 대기는 이벤트 루프에서 하므로 상한을 넘는 호출이 실행기 스레드를 붙잡지 않습니다.
+            async with self._call_semaphore():
+                response = await asyncio.to_thread(_send)
             response.raise_for_status()
             return response.json()
         except requests.HTTPError as exc:
@@ -185,7 +265,8 @@ class GooglePlacesService(PlacesServiceProtocol):
             logger.error("Google Places API response parse failed: %s", exc)
             return None
 
-    def _map_place(self, raw: dict[str, Any]) -> Place | None:
+    def _map_place_payload(self, raw: dict[str, Any]) -> dict[str, Any] | None:
+        """응답 항목을 Place 검증용 딕셔너리로 변환합니다."""
         display_name = raw.get("displayName") or {}
         name = display_name.get("text")
         location = raw.get("location") or {}
@@ -196,14 +277,14 @@ class GooglePlacesService(PlacesServiceProtocol):
         if not (name and place_id and latitude is not None and longitude is not None):
             return None
 
-        return Place(
-            place_id=place_id,
-            name=name,
-            address=raw.get("formattedAddress"),
-            geometry=PlaceGeometry(latitude=latitude, longitude=longitude),
-            url=raw.get("googleMapsUri"),
-            types=raw.get("types") or [],
-        )
+        return {
+            "place_id": place_id,
+            "name": name,
+            "address": raw.get("formattedAddress"),
+            "geometry": {"latitude": latitude, "longitude": longitude},
+            "url": raw.get("googleMapsUri"),
+            "types": raw.get("types") or [],
+        }
 
 
 @lru_cache(maxsize=1)
@@ -17,6 +17,10 @@ from app.graph.roadmap.utils import strip_code_fence
 
 logger = get_logger(__name__)
 
+# Only the fields the reranker reasons about go into the prompt; map URLs just add tokens.
+_PROMPT_CANDIDATE_FIELDS = ("place_id", "name", "address", "types", "geometry")
+_PROMPT_JSON_SEPARATORS = (",", ":")
+
 
 class RoadmapRerankChoice(BaseModel):
     """Selected place id per slot."""
@@ -37,6 +41,14 @@ class ChatRerankOutput(BaseModel):
     selected_place_id: str = Field(..., description="Selected Google place id")
 
 
+def _dump_prompt_json(payload: Any) -> str:
+    return json.dumps(payload, ensure_ascii=False, separators=_PROMPT_JSON_SEPARATORS)
+
+
+def _prompt_candidate(candidate: dict[str, Any]) -> dict[str, Any]:
+    return {field: candidate[field] for field in _PROMPT_CANDIDATE_FIELDS if candidate.get(field) is not None}
+
+
 def _trim_roadmap_slots(slots: list[dict[str, Any]], max_candidates: int) -> list[dict[str, Any]]:
     trimmed: list[dict[str, Any]] = []
     for slot in slots:
@@ -47,42 +59,51 @@ def _trim_roadmap_slots(slots: list[dict[str, Any]], max_candidates: int) -> lis
                 "section": slot.get("section"),
                 "area": slot.get("area"),
                 "keyword": slot.get("keyword"),
-                "candidates": candidates[:max_candidates],
+                "candidates": [_prompt_candidate(candidate) for candidate in candidates[:max_candidates]],
             }
         )
     return trimmed
 
 
 def _trim_chat_candidates(candidates: list[dict[str, Any]], max_candidates: int) -> list[dict[str, Any]]:
-    return candidates[:max_candidates]
+    return [_prompt_candidate(candidate) for candidate in candidates[:max_candidates]]
 
 
-async def select_place_ids_for_day(
+async def select_place_ids_for_days(
     *,
-    day_number: int,
-    slots: list[dict[str, Any]],
+    days: list[dict[str, Any]],
     max_candidates: int,
     timeout_seconds: int | None = None,
 ) -> dict[str, str] | None:
-    """Return slot_key -> selected place_id map or None on rerank failure."""
-    if not slots:
+    """Rerank every day's slots in one LLM call.
+
+    `days` items hold `day_number` and `slots`. Slot keys are unique across days,
+    so the result is a flat slot_key -> selected place_id map, or None on rerank failure.
+    """
+    trimmed_days = [
+        {"day_number": day.get("day_number"), "slots": _trim_roadmap_slots(day.get("slots", []), max_candidates)}
+        for day in days
+        if day.get("slots")
+    ]
+    if not trimmed_days:
         return {}
 
     parser = PydanticOutputParser(pydantic_object=RoadmapRerankOutput)
     timeout = timeout_seconds or get_timeout_policy().llm_timeout_seconds
-    trimmed_slots = _trim_roadmap_slots(slots, max_candidates=max_candidates)
+    trimmed_slots = [slot for day in trimmed_days for slot in day["slots"]]
+    day_numbers = ",".join(str(day["day_number"]) for day in trimmed_days)
 
     system_prompt = (
         "You are reranking Google Places candidates for itinerary slots.\n"
         "Pick one best place per slot based on slot keyword/area and candidate metadata.\n"
+        "Slots from several days may be given at once; return one choice for every slot_key.\n"
         "Never invent ids. Use only place_id from each slot candidate list.\n"
         "Return JSON only."
     )
-    user_prompt = "Day number: {day_number}\nSlot candidates:\n{slots}\n\n{format_instructions}"
+    user_prompt = "Day slot candidates:\n{days}\n\n{format_instructions}"
     prompt = ChatPromptTemplate.from_messages([("system", system_prompt), ("human", user_prompt)])
     messages = prompt.format_messages(
-        day_number=day_number,
-        slots=json.dumps(trimmed_slots, ensure_ascii=False, indent=2),
+        days=_dump_prompt_json(trimmed_days),
         format_instructions=parser.get_format_instructions(),
     )
 
@@ -92,17 +113,17 @@ async def select_place_ids_for_day(
             timeout=timeout,
         )
     except asyncio.TimeoutError:
-        logger.warning("Roadmap place rerank timed out: day=%s timeout=%s", day_number, timeout)
+        logger.warning("Roadmap place rerank timed out: days=%s timeout=%s", day_numbers, timeout)
         return None
     except Exception:
-        logger.exception("Roadmap place rerank call failed: day=%s", day_number)
+        logger.exception("Roadmap place rerank call failed: days=%s", day_numbers)
         return None
 
     try:
         raw_content = response.content if isinstance(response.content, str) else str(response.content)
         parsed = parser.parse(strip_code_fence(raw_content))
     except Exception:
-        logger.exception("Roadmap place rerank parse failed: day=%s", day_number)
+        logger.exception("Roadmap place rerank parse failed: days=%s", day_numbers)
         return None
 
     candidate_ids_by_slot: dict[str, set[str]] = {}
@@ -131,6 +152,21 @@ async def select_place_ids_for_day(
     return selected or None
 
 
+async def select_place_ids_for_day(
+    *,
+    day_number: int,
+    slots: list[dict[str, Any]],
+    max_candidates: int,
+    timeout_seconds: int | None = None,
+) -> dict[str, str] | None:
+    """Rerank a single day's slots; used when the all-days call fails."""
+    return await select_place_ids_for_days(
+        days=[{"day_number": day_number, "slots": slots}],
+        max_candidates=max_candidates,
+        timeout_seconds=timeout_seconds,
+    )
+
+
 async def select_place_id_for_chat(
     *,
     keyword: str,
@@ -173,8 +209,8 @@ async def select_place_id_for_chat(
     prompt = ChatPromptTemplate.from_messages([("system", system_prompt), ("human", user_prompt)])
     messages = prompt.format_messages(
         keyword=keyword,
-        day_context=json.dumps(reference_places, ensure_ascii=False, indent=2),
-        candidates=json.dumps(trimmed_candidates, ensure_ascii=False, indent=2),
+        day_context=_dump_prompt_json(reference_places),
+        candidates=_dump_prompt_json(trimmed_candidates),
         format_instructions=parser.get_format_instructions(),
     )
 
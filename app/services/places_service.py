@@ -17,8 +17,12 @@ class PlacesServiceProtocol(ABC):
         min_rating: float | None = None,
         location_restriction: GeoRectangle | None = None,
         location_bias: GeoRectangle | None = None,
+        max_results: int | None = None,
     ) -> list[Place]:
-        """검색어로 장소를 조회합니다."""
+        """검색어로 장소를 조회합니다.
+
+        max_results를 주면 제공자 기본값보다 적은 개수만 요청할 수 있습니다.
+        """
         raise NotImplementedError
 
     @abstractmethod
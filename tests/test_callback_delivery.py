@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+from types import SimpleNamespace
 
 import pytest
 import requests
@@ -47,7 +48,9 @@ def test_post_callback_with_retry_succeeds_after_retries(monkeypatch) -> None:
     async def _fake_sleep(delay: float) -> None:
         sleep_delays.append(delay)
 
-    monkeypatch.setattr("app.services.callback_delivery.requests.post", _fake_post)
+    monkeypatch.setattr(
+        "app.services.callback_delivery._get_callback_session", lambda: SimpleNamespace(post=_fake_post)
+    )
     monkeypatch.setattr("app.services.callback_delivery.asyncio.sleep", _fake_sleep)
 
     result = asyncio.run(
@@ -93,7 +96,9 @@ def test_post_callback_with_retry_does_not_retry_non_retryable_4xx(monkeypatch)
     async def _fake_sleep(delay: float) -> None:
         sleep_delays.append(delay)
 
-    monkeypatch.setattr("app.services.callback_delivery.requests.post", _fake_post)
+    monkeypatch.setattr(
+        "app.services.callback_delivery._get_callback_session", lambda: SimpleNamespace(post=_fake_post)
+    )
     monkeypatch.setattr("app.services.callback_delivery.asyncio.sleep", _fake_sleep)
 
     result = asyncio.run(
@@ -129,7 +134,9 @@ def test_post_callback_with_retry_does_not_retry_invalid_url(monkeypatch) -> Non
     async def _fake_sleep(delay: float) -> None:
         sleep_delays.append(delay)
 
-    monkeypatch.setattr("app.services.callback_delivery.requests.post", _fake_post)
+    monkeypatch.setattr(
+        "app.services.callback_delivery._get_callback_session", lambda: SimpleNamespace(post=_fake_post)
+    )
     monkeypatch.setattr("app.services.callback_delivery.asyncio.sleep", _fake_sleep)
 
     result = asyncio.run(
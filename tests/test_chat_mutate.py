@@ -0,0 +1,24 @@
+"""채팅 일정 수정 노드 테스트."""
+
+from __future__ import annotations
+
+from app.schemas.place import PLACE_LIST_ADAPTER, Place, PlaceGeometry
+
+
+def _place(place_id: str) -> Place:
+    return Place(place_id=place_id, name=f"name-{place_id}", geometry=PlaceGeometry(latitude=37.5, longitude=127.0))
+
+
+def test_move_selected_result_first_keeps_models_and_dumps_aligned() -> None:
+    from app.graph.chat.nodes.mutate import _move_selected_result_first
+
+    results = [_place("a"), _place("b"), _place("c")]
+    search_results = PLACE_LIST_ADAPTER.dump_python(results)
+
+    moved = _move_selected_result_first(results, search_results, "c")
+    not_moved = _move_selected_result_first(results, search_results, "missing")
+
+    assert moved is True
+    assert not_moved is False
+    assert [place.place_id for place in results] == ["c", "a", "b"]
+    assert [place["place_id"] for place in search_results] == ["c", "a", "b"]
@@ -0,0 +1,13 @@
+"""지리 유틸리티 테스트."""
+
+from __future__ import annotations
+
+from app.core.geo import GeoRectangle
+
+
+def test_contains_many_matches_contains_including_boundaries() -> None:
+    bbox = GeoRectangle(min_lat=37.0, min_lng=126.0, max_lat=38.0, max_lng=127.0)
+    points = [(37.5, 126.5), (37.0, 127.0), (36.9, 126.5), (37.5, 127.1)]
+
+    assert bbox.contains_many(points) == [bbox.contains(lat, lng) for lat, lng in points]
+    assert bbox.contains_many(points) == [True, True, False, False]
@@ -0,0 +1,177 @@
+"""Google Places 서비스 테스트."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import requests
+
+from app.services.google_places_service import GooglePlacesService
+
+
+class _FakeResponse:
+    def __init__(self, data: dict) -> None:
+        self._data = data
+
+    def raise_for_status(self) -> None:
+        return None
+
+    def json(self) -> dict:
+        return self._data
+
+
+def _raw_place(place_id: str, name: str) -> dict:
+    return {
+        "id": place_id,
+        "displayName": {"text": name},
+        "formattedAddress": "서울 종로구",
+        "location": {"latitude": 37.57, "longitude": 126.97},
+        "types": ["tourist_attraction"],
+    }
+
+
+def test_search_reuses_pooled_session_across_requests(monkeypatch) -> None:
+    service = GooglePlacesService(api_key="test-key")
+    sessions: list[int] = []
+
+    def _fake_request(**kwargs):
+        sessions.append(id(service._session))
+        return _FakeResponse({"places": [_raw_place("place-1", kwargs["json"]["textQuery"])]})
+
+    monkeypatch.setattr(service._session, "request", _fake_request)
+
+    async def _run():
+        return await asyncio.gather(service.search("경복궁"), service.search("창덕궁"))
+
+    first, second = asyncio.run(_run())
+    service.close()
+
+    assert [place.name for place in first] == ["경복궁"]
+    assert [place.name for place in second] == ["창덕궁"]
+    assert len(set(sessions)) == 1
+
+
+def test_search_drops_incomplete_places_and_validates_the_rest(monkeypatch) -> None:
+    service = GooglePlacesService(api_key="test-key")
+    incomplete = {"id": "place-2", "displayName": {"text": "좌표 없음"}}
+
+    def _fake_request(**_kwargs):
+        return _FakeResponse({"places": [_raw_place("place-1", "경복궁"), incomplete]})
+
+    monkeypatch.setattr(service._session, "request", _fake_request)
+
+    places = asyncio.run(service.search("경복궁"))
+    service.close()
+
+    assert len(places) == 1
+    assert places[0].place_id == "place-1"
+    assert places[0].geometry.latitude == 37.57
+    assert places[0].types == ["tourist_attraction"]
+
+
+def test_search_caches_empty_results_but_not_api_errors(monkeypatch) -> None:
+    service = GooglePlacesService(api_key="test-key", empty_result_cache_ttl_seconds=60)
+    calls: list[str] = []
+
+    def _fake_request(**kwargs):
+        query = kwargs["json"]["textQuery"]
+        calls.append(query)
+        if query == "오류":
+            raise requests.ConnectionError("boom")
+        return _FakeResponse({})
+
+    monkeypatch.setattr(service._session, "request", _fake_request)
+
+    async def _run():
+        for query in ("없는 장소", "없는 장소", "오류", "오류"):
+            assert await service.search(query) == []
+
+    asyncio.run(_run())
+    service.close()
+
+    assert calls == ["없는 장소", "오류", "오류"]
+
+
+def test_session_pool_does_not_block_executor_threads_when_full() -> None:
+    service = GooglePlacesService(api_key="test-key", pool_size=3, max_concurrency=2)
+    adapter = service._session.get_adapter("https://places.googleapis.com")
+    service.close()
+
+    assert adapter._pool_maxsize == 3
+    assert adapter._pool_block is False
+
+
+def test_search_caps_page_size_with_max_results(monkeypatch) -> None:
+    service = GooglePlacesService(api_key="test-key", page_size=5)
+    page_sizes: list[int] = []
+
+    def _fake_request(**kwargs):
+        page_sizes.append(kwargs["json"]["pageSize"])
+        return _FakeResponse({"places": [_raw_place("place-1", "경복궁")]})
+
+    monkeypatch.setattr(service._session, "request", _fake_request)
+
+    async def _run():
+        await service.search("경복궁")
+        await service.search("경복궁", max_results=3)
+        await service.search("경복궁", max_results=20)
+
+    asyncio.run(_run())
+    service.close()
+
+    assert page_sizes == [5, 3, 5]
+
+
+def test_search_coalesces_concurrent_identical_queries(monkeypatch) -> None:
+    service = GooglePlacesService(api_key="test-key")
+    calls: list[str] = []
+
+    def _fake_request(**kwargs):
+        calls.append(kwargs["json"]["textQuery"])
+        time.sleep(0.05)
+        return _FakeResponse({"places": [_raw_place("place-1", kwargs["json"]["textQuery"])]})
+
+    monkeypatch.setattr(service._session, "request", _fake_request)
+
+    async def _run():
+        concurrent = await asyncio.gather(service.search("경복궁"), service.search("경복궁"), service.search("창덕궁"))
+        return concurrent, await service.search("경복궁")
+
+    (first, second, other), later = asyncio.run(_run())
+    service.close()
+
+    assert sorted(calls) == ["경복궁", "경복궁", "창덕궁"]
+    assert first == second
+    assert first is not second
+    assert [place.name for place in other] == ["창덕궁"]
+    assert [place.name for place in later] == ["경복궁"]
+    assert service._inflight_searches == {}
+
+
+def test_search_caps_concurrent_calls_across_requests(monkeypatch) -> None:
+    service = GooglePlacesService(api_key="test-key", pool_size=2, max_concurrency=2)
+    lock = threading.Lock()
+    in_flight = {"current": 0, "max": 0}
+
+    def _fake_request(**kwargs):
+        with lock:
+            in_flight["current"] += 1
+            in_flight["max"] = max(in_flight["max"], in_flight["current"])
+        time.sleep(0.02)
+        with lock:
+            in_flight["current"] -= 1
+        return _FakeResponse({"places": [_raw_place("place-1", kwargs["json"]["textQuery"])]})
+
+    monkeypatch.setattr(service._session, "request", _fake_request)
+
+    async def _run():
+        return await asyncio.gather(*(service.search(f"장소 {index}") for index in range(6)))
+
+    results = asyncio.run(_run())
+    service.close()
+
+    assert [places[0].name for places in results] == [f"장소 {index}" for index in range(6)]
+    assert service._session.get_adapter("https://places.googleapis.com")._pool_maxsize == 2
+    assert in_flight["max"] == 2
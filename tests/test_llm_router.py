@@ -0,0 +1,57 @@
+"""Stage 기반 LLM 라우터 테스트."""
+
+from __future__ import annotations
+
+import asyncio
+
+from pydantic import BaseModel
+
+from app.core import llm_router
+from app.core.config import Settings
+from app.core.llm_router import Stage, json_schema_response_format
+
+
+class _Output(BaseModel):
+    title: str
+    note: str | None = None
+
+
+class _FakeClient:
+    def __init__(self) -> None:
+        self.kwargs: list[dict] = []
+
+    async def ainvoke(self, payload, **kwargs):
+        self.kwargs.append(kwargs)
+        return payload
+
+
+def _settings() -> Settings:
+    return Settings(OPENAI_API_KEY="test-key", SERVICE_SECRET="test-service-secret")
+
+
+def test_json_schema_response_format_uses_non_strict_model_schema() -> None:
+    response_format = json_schema_response_format(_Output)
+
+    assert response_format["type"] == "json_schema"
+    assert response_format["json_schema"]["name"] == "_Output"
+    assert response_format["json_schema"]["strict"] is False
+    assert set(response_format["json_schema"]["schema"]["properties"]) == {"title", "note"}
+
+
+def test_ainvoke_forwards_response_format_only_when_given(monkeypatch) -> None:
+    client = _FakeClient()
+    monkeypatch.setattr(llm_router, "_get_chat_openai_client", lambda *_args: client)
+    response_format = json_schema_response_format(_Output)
+
+    async def _run() -> None:
+        await llm_router.ainvoke(Stage.ROADMAP_SUMMARY, "payload", settings=_settings())
+        await llm_router.ainvoke(
+            Stage.ROADMAP_SUMMARY,
+            "payload",
+            settings=_settings(),
+            response_format=response_format,
+        )
+
+    asyncio.run(_run())
+
+    assert client.kwargs == [{}, {"response_format": response_format}]
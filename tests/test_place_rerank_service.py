@@ -0,0 +1,39 @@
+"""장소 재정렬 서비스 테스트."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+from app.graph.roadmap.utils import build_slot_key
+from app.services import place_rerank_service
+
+
+def test_select_place_ids_for_days_sends_compact_candidates(monkeypatch) -> None:
+    captured: list = []
+    slot_key = build_slot_key(1, 0)
+
+    async def _fake_ainvoke(stage, messages, timeout_seconds=None):
+        captured.extend(messages)
+        return SimpleNamespace(content=f'{{"choices": [{{"slot_key": "{slot_key}", "place_id": "p1"}}]}}')
+
+    monkeypatch.setattr(place_rerank_service, "ainvoke", _fake_ainvoke)
+    candidate = {
+        "place_id": "p1",
+        "name": "경복궁",
+        "address": None,
+        "geometry": {"latitude": 37.58, "longitude": 126.97},
+        "url": "https://maps.google.com/?cid=1234567890",
+        "types": ["tourist_attraction"],
+    }
+    days = [{"day_number": 1, "slots": [{"slot_key": slot_key, "keyword": "고궁", "candidates": [candidate]}]}]
+
+    selected = asyncio.run(
+        place_rerank_service.select_place_ids_for_days(days=days, max_candidates=5, timeout_seconds=5)
+    )
+
+    assert selected == {slot_key: "p1"}
+    human_prompt = captured[-1].content
+    assert '"place_id":"p1"' in human_prompt
+    assert "maps.google.com" not in human_prompt
+    assert '"address"' not in human_prompt
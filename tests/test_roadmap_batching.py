@@ -0,0 +1,45 @@
+"""마이크로 배칭 유틸 테스트."""
+
+from __future__ import annotations
+
+import asyncio
+
+from app.graph.roadmap.batching import MicroBatcher
+
+
+def test_micro_batcher_coalesces_concurrent_submissions() -> None:
+    flushed_batches: list[list[int]] = []
+
+    async def _flush(batch: list[int]) -> list[int | None]:
+        flushed_batches.append(batch)
+        return [value * 10 for value in batch]
+
+    async def _run() -> list[int | None]:
+        batcher = MicroBatcher(_flush, max_batch_size=8, window_seconds=0.01)
+        return await asyncio.gather(*(batcher.submit(value) for value in range(3)))
+
+    results = asyncio.run(_run())
+
+    assert results == [0, 10, 20]
+    assert flushed_batches == [[0, 1, 2]]
+
+
+def test_micro_batcher_flushes_when_batch_is_full_and_isolates_failures() -> None:
+    flushed_batches: list[list[int]] = []
+
+    async def _flush(batch: list[int]) -> list[int | None]:
+        flushed_batches.append(batch)
+        if 3 in batch:
+            raise RuntimeError("flush failed")
+        return batch
+
+    async def _run() -> list[int | None]:
+        batcher = MicroBatcher(_flush, max_batch_size=2, window_seconds=60)
+        first = asyncio.gather(*(batcher.submit(value) for value in (1, 2)))
+        second = asyncio.gather(*(batcher.submit(value) for value in (3, 4)))
+        return [*(await first), *(await second)]
+
+    results = asyncio.run(_run())
+
+    assert results == [1, 2, None, None]
+    assert flushed_batches == [[1, 2], [3, 4]]
@@ -0,0 +1,397 @@
+"""로드맵 최종 합성 노드 테스트."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+from app.core.config import get_settings
+
+
+def _set_required_env(monkeypatch, **overrides: str) -> None:
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setenv("SERVICE_SECRET", "test-service-secret")
+    for key, value in overrides.items():
+        monkeypatch.setenv(key, value)
+    get_settings.cache_clear()
+
+
+def _base_state(planning_preference: str) -> dict:
+    return {
+        "course_request": {
+            "start_date": "2026-02-01",
+            "end_date": "2026-02-01",
+            "regions": [{"region": "SEOUL", "start_date": "2026-02-01", "end_date": "2026-02-01"}],
+            "people_count": 2,
+            "companion_type": "FRIENDS",
+            "travel_themes": ["SIGHTSEEING"],
+            "pace_preference": "RELAXED",
+            "planning_preference": planning_preference,
+            "destination_preference": "TOURIST_SPOTS",
+            "activity_preference": "ACTIVE",
+            "priority_preference": "EFFICIENCY",
+            "budget_range": "MID",
+        },
+        "trip_days": 1,
+        "skeleton_plan": [
+            {
+                "day_number": 1,
+                "region": "SEOUL",
+                "slots": [{"section": "MORNING", "area": "종로", "keyword": "고궁 산책 명소 탐방"}],
+            }
+        ],
+        "fetched_places": {
+            "day1_slot0": [
+                {
+                    "place_id": "place-1",
+                    "name": "경복궁",
+                    "address": "서울 종로구",
+                    "geometry": {"latitude": 37.579617, "longitude": 126.977041},
+                    "url": None,
+                }
+            ]
+        },
+    }
+
+
+def _summary_response() -> SimpleNamespace:
+    return SimpleNamespace(
+        content=json.dumps(
+            {
+                "title": "서울 고궁 여행",
+                "summary": "고궁을 둘러보는 하루",
+                "tags": ["서울", "고궁", "산책"],
+                "llm_commentary": "고궁 중심의 여유로운 일정입니다.",
+            },
+            ensure_ascii=False,
+        )
+    )
+
+
+def test_synthesize_final_roadmap_skips_description_llm_when_not_planned(monkeypatch) -> None:
+    _set_required_env(monkeypatch, ROADMAP_UNPLANNED_FALLBACK_DESCRIPTIONS="true")
+    import app.graph.roadmap.nodes.finalize as finalize
+
+    async def _fail_description_llm(_daily_places):
+        raise AssertionError("description LLM should not be called")
+
+    async def _no_visit_time_proposals(_daily_places, **_kwargs):
+        return {}
+
+    async def _fake_ainvoke(_stage, _messages, **_kwargs):
+        return _summary_response()
+
+    monkeypatch.setattr(finalize, "_fill_place_descriptions_with_llm", _fail_description_llm)
+    monkeypatch.setattr(finalize, "propose_visit_times_for_days", _no_visit_time_proposals)
+    monkeypatch.setattr(finalize, "ainvoke", _fake_ainvoke)
+
+    result = asyncio.run(finalize.synthesize_final_roadmap(_base_state("SPONTANEOUS")))
+
+    assert "error" not in result
+    place = result["final_roadmap"]["itinerary"][0]["places"][0]
+    assert place["description"] == "경복궁에서 즐기는 대표 활동입니다."
+    assert result["final_roadmap"]["next_action_suggestion"] == finalize._safe_next_action_suggestions(1)
+
+
+def test_synthesize_final_roadmap_uses_description_llm_for_unplanned_by_default(monkeypatch) -> None:
+    _set_required_env(monkeypatch)
+    import app.graph.roadmap.nodes.finalize as finalize
+
+    async def _fake_description_llm(daily_places):
+        for day in daily_places:
+            for place in day["places"]:
+                place["description"] = "조선 왕조의 정궁"
+        return daily_places
+
+    async def _no_visit_time_proposals(_daily_places, **_kwargs):
+        return {}
+
+    async def _fake_ainvoke(_stage, _messages, **_kwargs):
+        return _summary_response()
+
+    monkeypatch.setattr(finalize, "_fill_place_descriptions_with_llm", _fake_description_llm)
+    monkeypatch.setattr(finalize, "propose_visit_times_for_days", _no_visit_time_proposals)
+    monkeypatch.setattr(finalize, "ainvoke", _fake_ainvoke)
+
+    result = asyncio.run(finalize.synthesize_final_roadmap(_base_state("SPONTANEOUS")))
+
+    assert result["final_roadmap"]["itinerary"][0]["places"][0]["description"] == "조선 왕조의 정궁"
+
+
+def test_synthesize_final_roadmap_gives_visit_time_proposals_a_snapshot(monkeypatch) -> None:
+    _set_required_env(monkeypatch)
+    import app.graph.roadmap.nodes.finalize as finalize
+
+    described: list[dict] = []
+    proposed: list[dict] = []
+
+    async def _fake_description_llm(daily_places):
+        described.extend(daily_places[0]["places"])
+        await asyncio.sleep(0)
+        daily_places[0]["places"][0]["description"] = "조선 왕조의 정궁"
+        return daily_places
+
+    async def _fake_visit_time_proposals(daily_places, **_kwargs):
+        proposed.extend(daily_places[0]["places"])
+        await asyncio.sleep(0)
+        return {}
+
+    async def _fake_ainvoke(_stage, _messages, **_kwargs):
+        return _summary_response()
+
+    monkeypatch.setattr(finalize, "_fill_place_descriptions_with_llm", _fake_description_llm)
+    monkeypatch.setattr(finalize, "propose_visit_times_for_days", _fake_visit_time_proposals)
+    monkeypatch.setattr(finalize, "ainvoke", _fake_ainvoke)
+
+    asyncio.run(finalize.synthesize_final_roadmap(_base_state("PLANNED")))
+
+    assert proposed[0] is not described[0]
+    assert proposed[0]["description"] == "경복궁에서 즐기는 대표 활동입니다."
+
+
+def test_fill_place_descriptions_with_llm_applies_llm_descriptions(monkeypatch) -> None:
+    _set_required_env(monkeypatch)
+    import app.graph.roadmap.nodes.finalize as finalize
+
+    async def _fake_ainvoke(_stage, _messages, **_kwargs):
+        return SimpleNamespace(
+            content=(
+                '```json\n{"days": [{"day_number": 1, "places": ['
+                '{"visit_sequence": 1, "description": "조선 왕조의 정궁"}, '
+                '{"visit_sequence": 2, "description": "  "}]}]}\n```'
+            )
+        )
+
+    monkeypatch.setattr(finalize, "ainvoke", _fake_ainvoke)
+    finalize._get_description_cache().clear()
+    daily_places = [
+        {
+            "day_number": 1,
+            "daily_date": "2026-02-01",
+            "places": [
+                {"place_name": "경복궁", "address": "서울 종로구 사직로 161", "visit_sequence": 1},
+                {"place_name": "북촌 한옥마을", "visit_sequence": 2},
+            ],
+        }
+    ]
+
+    result = asyncio.run(finalize._fill_place_descriptions_with_llm(daily_places))
+    name_key = finalize._description_cache_key({"place_name": " 경복궁 ", "address": "서울  종로구 사직로 161"})
+    cached_by_name = finalize._get_description_cache().get(name_key)
+    finalize._get_description_cache().clear()
+
+    places = result[0]["places"]
+    assert places[0]["description"] == "조선 왕조의 정궁"
+    assert places[1]["description"] == "북촌 한옥마을에서 즐기는 대표 활동입니다."
+    assert cached_by_name == "조선 왕조의 정궁"
+
+
+def test_description_cache_key_separates_same_name_places_without_place_id(monkeypatch) -> None:
+    _set_required_env(monkeypatch)
+    import app.graph.roadmap.nodes.finalize as finalize
+
+    daegu = finalize._description_cache_key({"place_name": "중앙시장", "address": "대구 중구"})
+    sokcho = finalize._description_cache_key({"place_name": "중앙시장", "address": "강원 속초시"})
+
+    assert daegu != sokcho
+    assert finalize._description_cache_key({"place_name": "중앙시장"}) is None
+    assert finalize._description_cache_key({"place_id": "p1", "place_name": "중앙시장"}) == ("p1", "v1")
+
+
+def test_request_place_details_maps_batched_response_by_request_id(monkeypatch) -> None:
+    _set_required_env(monkeypatch)
+    import app.graph.roadmap.nodes.finalize as finalize
+
+    async def _fake_ainvoke(_stage, _messages, **_kwargs):
+        return SimpleNamespace(
+            content=json.dumps(
+                {
+                    "requests": [
+                        {
+                            "request_id": 1,
+                            "days": [{"day_number": 1, "places": [{"visit_sequence": 1, "description": "B"}]}],
+                        },
+                        {"request_id": 7, "days": []},
+                    ]
+                }
+            )
+        )
+
+    monkeypatch.setattr(finalize, "ainvoke", _fake_ainvoke)
+    batch = [
+        [{"day_number": 1, "places": [{"visit_sequence": 1, "place_name": "A"}]}],
+        [{"day_number": 1, "places": [{"visit_sequence": 1, "place_name": "B"}]}],
+    ]
+
+    results = asyncio.run(finalize._request_place_details(batch))
+
+    assert results[0] is None
+    assert results[1].days[0].places[0].description == "B"
+
+
+def test_request_place_details_retries_each_request_alone_when_batch_fails(monkeypatch) -> None:
+    _set_required_env(monkeypatch)
+    import app.graph.roadmap.nodes.finalize as finalize
+
+    timeouts: list[int] = []
+
+    async def _fake_ainvoke(_stage, messages, **kwargs):
+        timeouts.append(kwargs["timeout_seconds"])
+        if '"requests"' in messages[-1].content:
+            raise RuntimeError("batch call failed")
+        name = "A" if '"place_name":"A"' in messages[-1].content else "B"
+        return SimpleNamespace(
+            content=json.dumps({"days": [{"day_number": 1, "places": [{"visit_sequence": 1, "description": name}]}]})
+        )
+
+    monkeypatch.setattr(finalize, "ainvoke", _fake_ainvoke)
+    batch = [
+        [{"day_number": 1, "places": [{"visit_sequence": 1, "place_name": "A"}]}],
+        [{"day_number": 1, "places": [{"visit_sequence": 1, "place_name": "B"}]}],
+    ]
+
+    results = asyncio.run(finalize._request_place_details(batch))
+
+    base_timeout = finalize.get_timeout_policy().llm_timeout_seconds
+    assert [result.days[0].places[0].description for result in results] == ["A", "B"]
+    assert timeouts == [base_timeout * 2, base_timeout, base_timeout]
+
+
+def test_place_detail_batcher_is_bound_to_running_loop(monkeypatch) -> None:
+    _set_required_env(monkeypatch)
+    import app.graph.roadmap.nodes.finalize as finalize
+
+    async def _get_twice():
+        return finalize._get_place_detail_batcher(), finalize._get_place_detail_batcher()
+
+    first, same_loop = asyncio.run(_get_twice())
+    second, _ = asyncio.run(_get_twice())
+
+    assert first is same_loop
+    assert first is not second
+
+
+def test_fill_place_descriptions_with_llm_skips_llm_for_cached_places(monkeypatch) -> None:
+    _set_required_env(monkeypatch)
+    import app.graph.roadmap.nodes.finalize as finalize
+
+    calls: list[str] = []
+
+    async def _fake_ainvoke(_stage, messages, **_kwargs):
+        calls.append(messages[-1].content)
+        return SimpleNamespace(
+            content='{"days": [{"day_number": 1, "places": [{"visit_sequence": 1, "description": "고궁 산책"}]}]}'
+        )
+
+    monkeypatch.setattr(finalize, "ainvoke", _fake_ainvoke)
+    finalize._get_description_cache().clear()
+
+    def _daily_places() -> list[dict]:
+        return [
+            {
+                "day_number": 1,
+                "daily_date": "2026-02-01",
+                "places": [{"place_name": "경복궁", "place_id": "place-1", "visit_sequence": 1}],
+            }
+        ]
+
+    first = asyncio.run(finalize._fill_place_descriptions_with_llm(_daily_places()))
+    second = asyncio.run(finalize._fill_place_descriptions_with_llm(_daily_places()))
+    finalize._get_description_cache().clear()
+
+    assert len(calls) == 1
+    assert first[0]["places"][0]["description"] == "고궁 산책"
+    assert second[0]["places"][0]["description"] == "고궁 산책"
+
+
+def test_prepare_final_context_builds_quoted_maps_url_when_missing(monkeypatch) -> None:
+    _set_required_env(monkeypatch)
+    import app.graph.roadmap.nodes.finalize as finalize
+
+    state = _base_state("PLANNED")
+    state["fetched_places"]["day1_slot0"][0]["name"] = "경복궁 & 광화문"
+
+    context, daily_places, course_request = finalize._prepare_final_context(state)
+
+    place = daily_places[0]["places"][0]
+    assert place["place_url"] == (
+        "https://www.google.com/maps/search/?api=1&query="
+        "%EA%B2%BD%EB%B3%B5%EA%B6%81+%26+%EA%B4%91%ED%99%94%EB%AC%B8&query_place_id=place-1"
+    )
+    assert "Day 1 (2026-02-01):" in context
+    assert daily_places[0]["daily_date"] == "2026-02-01"
+    assert course_request.planning_preference == "PLANNED"
+
+
+def test_synthesize_final_roadmap_runs_description_and_visit_time_concurrently(monkeypatch) -> None:
+    _set_required_env(monkeypatch)
+    import app.graph.roadmap.nodes.finalize as finalize
+
+    events: list[str] = []
+
+    async def _fake_descriptions(daily_places):
+        events.append("description:start")
+        await asyncio.sleep(0.01)
+        events.append("description:end")
+        return finalize._apply_fallback_descriptions(daily_places)
+
+    async def _fake_visit_time_proposals(_daily_places, **_kwargs):
+        events.append("visit_time:start")
+        await asyncio.sleep(0.01)
+        events.append("visit_time:end")
+        return {1: {1: "10:00"}}
+
+    async def _fake_ainvoke(_stage, _messages, **_kwargs):
+        return _summary_response()
+
+    monkeypatch.setattr(finalize, "_fill_place_descriptions_with_llm", _fake_descriptions)
+    monkeypatch.setattr(finalize, "propose_visit_times_for_days", _fake_visit_time_proposals)
+    monkeypatch.setattr(finalize, "ainvoke", _fake_ainvoke)
+
+    result = asyncio.run(finalize.synthesize_final_roadmap(_base_state("PLANNED")))
+
+    assert events[:2] == ["description:start", "visit_time:start"]
+    assert result["final_roadmap"]["itinerary"][0]["places"][0]["visit_time"] == "10:00"
+
+
+def test_synthesize_final_roadmap_serializes_course_request_as_compact_json(monkeypatch) -> None:
+    _set_required_env(monkeypatch)
+    import app.graph.roadmap.nodes.finalize as finalize
+
+    captured: list = []
+
+    async def _no_visit_time_proposals(_daily_places, **_kwargs):
+        return {}
+
+    async def _fake_ainvoke(_stage, messages, **_kwargs):
+        captured.extend(messages)
+        return _summary_response()
+
+    monkeypatch.setattr(finalize, "propose_visit_times_for_days", _no_visit_time_proposals)
+    monkeypatch.setattr(finalize, "ainvoke", _fake_ainvoke)
+
+    asyncio.run(finalize.synthesize_final_roadmap(_base_state("SPONTANEOUS")))
+
+    human_prompt = captured[-1].content
+    assert '"people_count":2' in human_prompt
+    assert '"budget_range"' not in human_prompt
+
+
+def test_prepare_final_context_reuses_validated_course_request(monkeypatch) -> None:
+    _set_required_env(monkeypatch)
+    import app.graph.roadmap.nodes.finalize as finalize
+    from app.schemas.course import CourseRequest
+
+    state = _base_state("PLANNED")
+    request = CourseRequest.model_validate(state["course_request"])
+    state["course_request"] = request
+
+    def _fail(*_args, **_kwargs):
+        raise AssertionError("이미 검증된 CourseRequest는 다시 검증하지 않아야 합니다.")
+
+    monkeypatch.setattr(CourseRequest, "model_validate", _fail)
+
+    _, _, course_request = finalize._prepare_final_context(state)
+
+    assert course_request is request
@@ -0,0 +1,302 @@
+"""로드맵 장소 검색 노드 테스트."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from types import SimpleNamespace
+
+from app.core.config import get_settings
+from app.core.geo import GeoRectangle
+from app.schemas.place import Place, PlaceGeometry
+from app.services.places_service import PlacesServiceProtocol
+
+
+def _set_required_env(monkeypatch, **overrides: str) -> None:
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setenv("SERVICE_SECRET", "test-service-secret")
+    monkeypatch.setenv("GOOGLE_PLACES_LLM_RERANK_ENABLED", "false")
+    for key, value in overrides.items():
+        monkeypatch.setenv(key, value)
+    get_settings.cache_clear()
+
+
+def _place(place_id: str, latitude: float = 37.57, longitude: float = 126.98) -> Place:
+    return Place(
+        place_id=place_id,
+        name=f"name-{place_id}",
+        geometry=PlaceGeometry(latitude=latitude, longitude=longitude),
+    )
+
+
+class _FakePlacesService(PlacesServiceProtocol):
+    def __init__(self, delay_seconds: float = 0.0, empty: bool = False) -> None:
+        self.calls: list[dict] = []
+        self._empty = empty
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._delay_seconds = delay_seconds
+
+    async def search(
+        self,
+        query: str,
+        price_levels: list[str] | None = None,
+        min_rating: float | None = None,
+        location_restriction: GeoRectangle | None = None,
+        location_bias: GeoRectangle | None = None,
+        max_results: int | None = None,
+    ) -> list[Place]:
+        self.calls.append(
+            {
+                "query": query,
+                "price_levels": price_levels,
+                "min_rating": min_rating,
+                "location_restriction": location_restriction,
+                "location_bias": location_bias,
+                "max_results": max_results,
+            }
+        )
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self._delay_seconds)
+        finally:
+            self.in_flight -= 1
+        if self._empty:
+            return []
+        return [_place(f"{query}-1"), _place(f"{query}-2")]
+
+    async def details(self, place_id: str) -> Place | None:
+        return None
+
+
+def _state(slot_count: int) -> dict:
+    return {
+        "course_request": {"budget_range": "MID"},
+        "skeleton_plan": [
+            {
+                "day_number": 1,
+                "region": "SEOUL",
+                "slots": [
+                    {"section": "MORNING", "area": "종로", "keyword": f"고궁 산책 코스 {index}"}
+                    for index in range(slot_count)
+                ],
+            }
+        ],
+    }
+
+
+def test_fetch_places_from_slots_bounds_search_concurrency(monkeypatch) -> None:
+    _set_required_env(monkeypatch, GOOGLE_PLACES_MAX_CONCURRENCY="2")
+    from app.graph.roadmap.nodes.places import fetch_places_from_slots
+
+    service = _FakePlacesService(delay_seconds=0.01)
+    result = asyncio.run(
+        fetch_places_from_slots(_state(6), {"configurable": {"places_service": service}}),
+    )
+
+    assert len(service.calls) == 6
+    assert service.max_in_flight == 2
+    assert service.calls[0]["max_results"] is None
+    assert result["fetched_places"]["day1_slot0"][0]["place_id"] == "종로 고궁 산책 코스 0-1"
+
+
+def test_is_food_keyword_matches_any_hint_case_insensitively(monkeypatch) -> None:
+    _set_required_env(monkeypatch)
+    from app.graph.roadmap.nodes.places import _is_food_keyword
+
+    assert _is_food_keyword("성수 브런치 카페")
+    assert _is_food_keyword("Local Coffee Roasters")
+    assert _is_food_keyword(" 카페 ")
+    assert not _is_food_keyword("고궁 산책 코스")
+    assert not _is_food_keyword("")
+
+
+def test_move_selected_first_rotates_list_in_place(monkeypatch) -> None:
+    _set_required_env(monkeypatch)
+    from app.graph.roadmap.nodes.places import _move_selected_first
+
+    places = [{"place_id": "a"}, {"place_id": "b"}, {"place_id": "c"}]
+
+    reordered, moved = _move_selected_first(places, "c")
+    unchanged, not_moved = _move_selected_first(places, "missing")
+
+    assert moved is True
+    assert reordered is places
+    assert [place["place_id"] for place in places] == ["c", "a", "b"]
+    assert not_moved is False
+    assert unchanged is places
+
+
+def test_fetch_places_from_slots_reranks_all_days_in_one_call(monkeypatch) -> None:
+    _set_required_env(monkeypatch, GOOGLE_PLACES_LLM_RERANK_ENABLED="true")
+    import app.graph.roadmap.nodes.places as places_node
+
+    rerank_calls: list[list[int]] = []
+
+    async def _fake_select_place_ids_for_days(*, days, **_kwargs):
+        rerank_calls.append([day["day_number"] for day in days])
+        return {slot["slot_key"]: slot["candidates"][1]["place_id"] for day in days for slot in day["slots"]}
+
+    monkeypatch.setattr(places_node, "select_place_ids_for_days", _fake_select_place_ids_for_days)
+    state = _state(1)
+    state["skeleton_plan"].append(
+        {"day_number": 2, "region": "SEOUL", "slots": [{"section": "MORNING", "area": "중구", "keyword": "시장 구경"}]}
+    )
+
+    service = _FakePlacesService()
+    result = asyncio.run(
+        places_node.fetch_places_from_slots(state, {"configurable": {"places_service": service}}),
+    )
+
+    assert rerank_calls == [[1, 2]]
+    assert {call["max_results"] for call in service.calls} == {5}
+    assert [place["place_id"] for place in result["fetched_places"]["day1_slot0"]] == [
+        "종로 고궁 산책 코스 0-2",
+        "종로 고궁 산책 코스 0-1",
+    ]
+    assert result["fetched_places"]["day2_slot0"][0]["place_id"] == "중구 시장 구경-2"
+
+
+def test_fetch_places_from_slots_falls_back_to_per_day_rerank(monkeypatch, caplog) -> None:
+    _set_required_env(
+        monkeypatch,
+        GOOGLE_PLACES_LLM_RERANK_ENABLED="true",
+        GOOGLE_PLACES_LLM_RERANK_MAX_CONCURRENCY="1",
+    )
+    import app.graph.roadmap.nodes.places as places_node
+
+    all_days_timeouts: list[int] = []
+    day_calls: list[tuple[int, int]] = []
+    in_flight = {"current": 0, "max": 0}
+
+    async def _failing_select_place_ids_for_days(*, timeout_seconds, **_kwargs):
+        all_days_timeouts.append(timeout_seconds)
+        return None
+
+    async def _fake_select_place_ids_for_day(*, day_number, slots, timeout_seconds, **_kwargs):
+        day_calls.append((day_number, timeout_seconds))
+        in_flight["current"] += 1
+        in_flight["max"] = max(in_flight["max"], in_flight["current"])
+        await asyncio.sleep(0)
+        in_flight["current"] -= 1
+        if day_number == 2:
+            return None
+        return {slot["slot_key"]: slot["candidates"][1]["place_id"] for slot in slots}
+
+    monkeypatch.setattr(places_node, "select_place_ids_for_days", _failing_select_place_ids_for_days)
+    monkeypatch.setattr(places_node, "select_place_ids_for_day", _fake_select_place_ids_for_day)
+    state = _state(1)
+    state["skeleton_plan"].append(
+        {"day_number": 2, "region": "SEOUL", "slots": [{"section": "MORNING", "area": "중구", "keyword": "시장 구경"}]}
+    )
+
+    with caplog.at_level(logging.INFO, logger=places_node.__name__):
+        result = asyncio.run(
+            places_node.fetch_places_from_slots(state, {"configurable": {"places_service": _FakePlacesService()}}),
+        )
+
+    rerank_timeout = places_node.get_timeout_policy(get_settings()).llm_timeout_seconds
+    assert "fallback_used=true multi_day_failed=true" in caplog.text
+    assert all_days_timeouts == [rerank_timeout * 2]
+    assert sorted(day_calls) == [(1, rerank_timeout), (2, rerank_timeout)]
+    assert in_flight["max"] == 1
+    assert result["fetched_places"]["day1_slot0"][0]["place_id"] == "종로 고궁 산책 코스 0-2"
+    assert result["fetched_places"]["day2_slot0"][0]["place_id"] == "중구 시장 구경-1"
+
+
+def test_rerank_log_keeps_fallback_used_false_when_per_day_rerank_succeeds(monkeypatch, caplog) -> None:
+    _set_required_env(monkeypatch, GOOGLE_PLACES_LLM_RERANK_ENABLED="true")
+    import app.graph.roadmap.nodes.places as places_node
+
+    async def _failing_select_place_ids_for_days(**_kwargs):
+        return None
+
+    async def _fake_select_place_ids_for_day(*, slots, **_kwargs):
+        return {slot["slot_key"]: slot["candidates"][1]["place_id"] for slot in slots}
+
+    monkeypatch.setattr(places_node, "select_place_ids_for_days", _failing_select_place_ids_for_days)
+    monkeypatch.setattr(places_node, "select_place_ids_for_day", _fake_select_place_ids_for_day)
+
+    with caplog.at_level(logging.INFO, logger=places_node.__name__):
+        asyncio.run(
+            places_node.fetch_places_from_slots(_state(1), {"configurable": {"places_service": _FakePlacesService()}}),
+        )
+
+    assert "fallback_used=false multi_day_failed=true" in caplog.text
+
+
+def test_fetch_places_from_slots_deduplicates_identical_searches(monkeypatch) -> None:
+    _set_required_env(monkeypatch)
+    from app.graph.roadmap.nodes.places import fetch_places_from_slots
+
+    state = _state(1)
+    state["skeleton_plan"].append(
+        {
+            "day_number": 2,
+            "region": "SEOUL",
+            "slots": [{"section": "AFTERNOON", "area": "종로", "keyword": "고궁  산책 코스 0"}],
+        }
+    )
+    service = _FakePlacesService()
+
+    result = asyncio.run(fetch_places_from_slots(state, {"configurable": {"places_service": service}}))
+
+    fetched_places = result["fetched_places"]
+    assert len(service.calls) == 1
+    assert fetched_places["day1_slot0"] == fetched_places["day2_slot0"]
+    assert fetched_places["day1_slot0"] is not fetched_places["day2_slot0"]
+
+
+def test_search_for_slot_skips_fallbacks_that_repeat_previous_search(monkeypatch) -> None:
+    _set_required_env(monkeypatch, GOOGLE_PLACES_MIN_RATING="4.0")
+    from app.graph.roadmap.nodes.places import fetch_places_from_slots
+
+    state = _state(1)
+    state["skeleton_plan"][0]["region"] = None
+    state["course_request"]["budget_range"] = None
+    service = _FakePlacesService(empty=True)
+
+    result = asyncio.run(fetch_places_from_slots(state, {"configurable": {"places_service": service}}))
+
+    assert result["fetched_places"]["day1_slot0"] == []
+    assert [(call["price_levels"], call["min_rating"], call["location_restriction"]) for call in service.calls] == [
+        (None, 4.0, None),
+        (None, None, None),
+    ]
+
+
+def test_fetch_places_from_slots_times_out_slow_searches(monkeypatch) -> None:
+    _set_required_env(monkeypatch)
+    import app.graph.roadmap.nodes.places as places_node
+
+    monkeypatch.setattr(
+        places_node,
+        "get_timeout_policy",
+        lambda _settings=None: SimpleNamespace(llm_timeout_seconds=1, google_places_timeout_seconds=0.01),
+    )
+    service = _FakePlacesService(delay_seconds=1.0)
+
+    result = asyncio.run(
+        places_node.fetch_places_from_slots(_state(1), {"configurable": {"places_service": service}}),
+    )
+
+    assert len(service.calls) == 1
+    assert result["fetched_places"]["day1_slot0"] == []
+
+
+def test_fetch_places_from_slots_shares_identical_fallback_calls(monkeypatch) -> None:
+    _set_required_env(monkeypatch)
+    from app.graph.roadmap.nodes.places import fetch_places_from_slots
+
+    state = _state(1)
+    state["skeleton_plan"].append({**state["skeleton_plan"][0], "day_number": 2, "region": None})
+    service = _FakePlacesService(empty=True)
+
+    asyncio.run(fetch_places_from_slots(state, {"configurable": {"places_service": service}}))
+
+    stages = [
+        (call["price_levels"], call["min_rating"], call["location_restriction"], call["location_bias"])
+        for call in service.calls
+    ]
+    assert len(stages) == len(set(stages)) == 4
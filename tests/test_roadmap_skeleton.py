@@ -0,0 +1,211 @@
+"""로드맵 스켈레톤 생성 노드 테스트."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.config import get_settings
+
+
+def _set_required_env(monkeypatch, **overrides: str) -> None:
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setenv("SERVICE_SECRET", "test-service-secret")
+    for key, value in overrides.items():
+        monkeypatch.setenv(key, value)
+    get_settings.cache_clear()
+
+
+def _course_request() -> dict:
+    return {
+        "start_date": "2026-02-01",
+        "end_date": "2026-02-02",
+        "regions": [
+            {"region": "BUSAN", "start_date": "2026-02-02", "end_date": "2026-02-02"},
+            {"region": "SEOUL", "start_date": "2026-02-01", "end_date": "2026-02-01"},
+        ],
+        "people_count": 2,
+        "companion_type": "FRIENDS",
+        "travel_themes": ["SIGHTSEEING"],
+        "pace_preference": "RELAXED",
+        "planning_preference": "PLANNED",
+        "destination_preference": "TOURIST_SPOTS",
+        "activity_preference": "ACTIVE",
+        "priority_preference": "EFFICIENCY",
+        "budget_range": "MID",
+    }
+
+
+def _segment_plan(region: str) -> str:
+    slots = [
+        {"section": "MORNING", "area": "중심가", "keyword": f"{region} 대표 명소 도보 탐방"},
+        {"section": "LUNCH", "area": "중심가", "keyword": f"{region} 현지 인기 점심 식사"},
+        {"section": "AFTERNOON", "area": "중심가", "keyword": f"{region} 문화 전시 체험 활동"},
+        {"section": "DINNER", "area": "중심가", "keyword": f"{region} 현지 인기 저녁 식사"},
+    ]
+    return json.dumps({"days": [{"day_number": 1, "region": region, "slots": slots}]}, ensure_ascii=False)
+
+
+@pytest.mark.parametrize(("max_concurrency", "expected_in_flight"), [("4", 2), ("1", 1)])
+def test_generate_skeleton_runs_region_segments_concurrently(
+    monkeypatch, max_concurrency: str, expected_in_flight: int
+) -> None:
+    _set_required_env(monkeypatch, ROADMAP_SKELETON_MAX_CONCURRENCY=max_concurrency)
+    import app.graph.roadmap.nodes.skeleton as skeleton
+
+    in_flight = 0
+    max_in_flight = 0
+
+    async def _fake_ainvoke(_stage, messages, **_kwargs):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        region = "SEOUL" if "'SEOUL'" in messages[0].content else "BUSAN"
+        return SimpleNamespace(content=_segment_plan(region))
+
+    monkeypatch.setattr(skeleton, "ainvoke", _fake_ainvoke)
+
+    result = asyncio.run(skeleton.generate_skeleton({"course_request": _course_request()}))
+
+    assert "error" not in result
+    assert max_in_flight == expected_in_flight
+    assert [(day["day_number"], day["region"]) for day in result["skeleton_plan"]] == [(1, "SEOUL"), (2, "BUSAN")]
+
+
+def test_build_slot_targets_keeps_edges_light() -> None:
+    from app.graph.roadmap.nodes.skeleton import _build_slot_targets
+
+    assert _build_slot_targets(0, 4, 5) == []
+    assert _build_slot_targets(1, 4, 5) == [4]
+    assert _build_slot_targets(2, 4, 5) == [5, 4]
+    assert _build_slot_targets(4, 4, 5) == [4, 5, 5, 4]
+    assert _build_slot_targets(3, 5, 5) == [5, 5, 5]
+
+
+def test_normalize_region_ranges_orders_segments_and_reports_gaps() -> None:
+    from datetime import date
+
+    from app.graph.roadmap.nodes.skeleton import _normalize_region_ranges
+    from app.schemas.course import RegionDateRange
+
+    seoul = RegionDateRange(region="SEOUL", start_date=date(2026, 2, 1), end_date=date(2026, 2, 1))
+    busan = RegionDateRange(region="BUSAN", start_date=date(2026, 2, 3), end_date=date(2026, 2, 3))
+
+    ordered, errors = _normalize_region_ranges([busan, seoul], date(2026, 2, 1), date(2026, 2, 3))
+
+    assert ordered == [seoul, busan]
+    assert len(errors) == 1
+    assert "빈 날짜" in errors[0]
+
+
+def test_digit_helpers_count_without_regex_lists() -> None:
+    from app.graph.roadmap.nodes.skeleton import _digit_ratio, _looks_like_phone
+
+    assert _looks_like_phone("문의 010-1234-5678")
+    assert not _looks_like_phone("1박 2일 코스")
+    assert _digit_ratio("12 ab") == 0.5
+    assert _digit_ratio("   ") == 0.0
+
+
+def test_build_segment_prompt_reuses_module_template(monkeypatch) -> None:
+    _set_required_env(monkeypatch)
+    import app.graph.roadmap.nodes.skeleton as skeleton
+    from app.schemas.course import CourseRequest
+
+    def _fail(*_args, **_kwargs):
+        raise AssertionError("프롬프트 템플릿을 다시 만들면 안 됩니다.")
+
+    monkeypatch.setattr(skeleton.ChatPromptTemplate, "from_messages", _fail)
+    request = CourseRequest.model_validate(_course_request())
+
+    messages = skeleton._build_segment_prompt(request, request.regions[1], 1, 4, 5, [4])
+
+    assert "4~5개의 슬롯" in messages[0].content
+    assert "Day1=4" in messages[0].content
+
+
+def test_search_risk_checks_classify_each_category() -> None:
+    from app.graph.roadmap.nodes.skeleton import _is_search_unfriendly, _looks_like_detail_address
+
+    assert _is_search_unfriendly("37.5665, 126.9780")
+    assert _is_search_unfriendly("c/o 관리사무소")
+    assert not _is_search_unfriendly("종로 123번지")
+    assert _looks_like_detail_address("종로 123번지")
+    assert not _is_search_unfriendly("익선동 한옥 골목 산책")
+    assert not _looks_like_detail_address("익선동 한옥 골목 산책")
+
+
+def test_search_risk_categories_do_not_hide_each_other() -> None:
+    from app.graph.roadmap.nodes.skeleton import _looks_like_coordinates, _looks_like_detail_address, _looks_like_phone
+
+    # 8자리 미만이라 전화번호가 아닌 숫자열이 바로 뒤의 주소 패턴을 가리지 않아야 합니다.
+    assert _looks_like_detail_address("서울특별시 강남구 역삼동 테헤란 근처 아주 좋은 곳 1 2 3 4 5로")
+    # 좌표 매치가 뒤이은 전화번호 숫자열을 흡수하지 않아야 합니다.
+    assert _looks_like_coordinates("1.5, 2.0123456789")
+    assert _looks_like_phone("1.5, 2.0123456789")
+
+
+def test_search_risk_gate_skips_regex_for_hangul_only_text(monkeypatch) -> None:
+    import app.graph.roadmap.nodes.skeleton as skeleton
+
+    class _FailingPattern:
+        def search(self, _text):
+            raise AssertionError("한글만 있는 텍스트는 정규식을 실행하지 않아야 합니다.")
+
+    monkeypatch.setattr(
+        skeleton, "_SEARCH_RISK_PATTERNS", dict.fromkeys(skeleton._SEARCH_RISK_PATTERNS, _FailingPattern())
+    )
+    skeleton._search_risk_categories.cache_clear()
+
+    assert not skeleton._is_search_unfriendly("북촌 한옥마을 골목 산책")
+    assert not skeleton._looks_like_detail_address("성수 카페 거리")
+    skeleton._search_risk_categories.cache_clear()
+
+
+def test_most_common_area_prefers_first_seen_on_ties() -> None:
+    from app.graph.roadmap.nodes.skeleton import _most_common_area
+
+    assert _most_common_area(["종로", "성수", "성수", "종로"]) == "종로"
+    assert _most_common_area(["종로", "성수", "성수"]) == "성수"
+    assert _most_common_area([]) is None
+
+
+def test_slot_range_accepts_enum_and_raw_values() -> None:
+    from app.graph.roadmap.nodes.skeleton import _slot_range
+    from app.schemas.enums import PacePreference
+
+    assert _slot_range(PacePreference.DENSE) == (6, 7)
+    assert _slot_range("RELAXED") == (4, 5)
+    assert _slot_range(None) == (5, 6)
+    assert _slot_range("UNKNOWN") == (5, 6)
+
+
+def test_area_warnings_flag_days_with_too_many_areas() -> None:
+    from app.graph.roadmap.nodes.skeleton import _area_warnings
+    from app.schemas.skeleton import SkeletonPlan
+
+    def _day(day_number: int, areas: list[str]) -> dict:
+        slots = [{"section": "MORNING", "area": area, "keyword": "대표 명소 도보 탐방"} for area in areas]
+        return {"day_number": day_number, "region": "SEOUL", "slots": slots}
+
+    plan = SkeletonPlan.model_validate(
+        {"days": [_day(1, ["종로", "종로 ", "중구", "성수"]), _day(2, ["종로", "중구", "성수", "마포", "강남"])]}
+    )
+
+    assert _area_warnings(plan) == ["2일차에 서로 다른 지역이 4개 이상입니다. 이동 동선을 고려하세요."]
+
+
+def test_section_template_for_count_uses_precomputed_tuples() -> None:
+    from app.graph.roadmap.nodes.skeleton import _section_template_for_count
+
+    assert _section_template_for_count(4) == ("MORNING", "LUNCH", "AFTERNOON", "DINNER")
+    assert _section_template_for_count(7)[:2] == ("MORNING", "MORNING")
+    assert _section_template_for_count(2) == ("MORNING", "LUNCH")
+    assert _section_template_for_count(0) == ()
+    assert _section_template_for_count(13)[-1] == "NIGHT"
+    assert _section_template_for_count(5) is _section_template_for_count(5)
@@ -0,0 +1,20 @@
+"""로드맵 공통 유틸리티 테스트."""
+
+from __future__ import annotations
+
+from app.graph.roadmap.utils import build_search_query, strip_code_fence
+
+
+def test_strip_code_fence_keeps_first_fenced_block_only() -> None:
+    assert strip_code_fence('```json\n{"a": 1}\n```') == '{"a": 1}'
+    assert strip_code_fence('  ```\n{"a": 1}\n```\n설명```{"b": 2}```') == '{"a": 1}'
+    assert strip_code_fence('```json\n{"a": 1}') == '{"a": 1}'
+    assert strip_code_fence(' {"a": 1} ') == '{"a": 1}'
+    assert strip_code_fence(None) == ""
+
+
+def test_build_search_query_joins_only_non_empty_parts() -> None:
+    assert build_search_query({"area": " 종로 ", "keyword": " 고궁 "}) == "종로 고궁"
+    assert build_search_query({"area": " ", "keyword": "고궁"}) == "고궁"
+    assert build_search_query({"area": "종로"}) == "종로"
+    assert build_search_query({}) == ""
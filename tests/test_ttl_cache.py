@@ -0,0 +1,30 @@
+"""TTL 캐시 유틸 테스트."""
+
+from __future__ import annotations
+
+from app.core import ttl_cache
+from app.core.ttl_cache import TTLCache
+
+
+def test_ttl_cache_expires_entries(monkeypatch) -> None:
+    now = [100.0]
+    monkeypatch.setattr(ttl_cache, "monotonic", lambda: now[0])
+    cache: TTLCache[str, str] = TTLCache(max_size=10, ttl_seconds=5)
+
+    cache.set("a", "value")
+    assert cache.get("a") == "value"
+
+    now[0] = 105.0
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_ttl_cache_evicts_least_recently_used() -> None:
+    cache: TTLCache[str, int] = TTLCache(max_size=2, ttl_seconds=60)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert cache.get_many(["a", "b", "c"]) == {"a": 1, "c": 3}